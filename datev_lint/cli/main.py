@@ -171,9 +171,10 @@ def validate(
         typer.echo(rendered)
 
     # Determine exit code
-    has_fatal = any(f.severity.value == "fatal" for f in result.findings)
-    has_error = any(f.severity.value == "error" for f in result.findings)
-    has_warn = any(f.severity.value == "warn" for f in result.findings)
+    summary = result.get_summary()
+    has_fatal = summary.fatal_count > 0
+    has_error = summary.error_count > 0
+    has_warn = summary.warn_count > 0
 
     exit_code = get_exit_code(has_fatal, has_error, has_warn, fail_on)
     raise typer.Exit(exit_code)
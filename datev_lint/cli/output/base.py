@@ -6,12 +6,23 @@ Defines the interface for output adapters.
 
 from __future__ import annotations
 
+import json
 import sys
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import TYPE_CHECKING, TextIO
+from typing import TYPE_CHECKING, Any, TextIO
+
+# Try to import orjson, fall back to the stdlib encoder
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from datev_lint.core.fix.models import PatchPlan
     from datev_lint.core.rules.models import Finding, ValidationSummary
     from datev_lint.core.rules.pipeline import PipelineResult
@@ -26,6 +37,29 @@ class OutputFormat(Enum):
     JUNIT = "junit"
 
 
+def dump_json(
+    data: Any,
+    indent: int | None = 2,
+    default: Callable[[Any], Any] | None = None,
+) -> str:
+    """
+    Serialize data to a JSON string.
+
+    Uses orjson when it is installed and supports the requested indent
+    (none or 2 spaces). The stdlib encoder falls back to pure Python as
+    soon as indent is set, which dominates rendering large finding lists.
+    orjson writes non-ASCII characters as UTF-8 instead of escaping them;
+    the parsed document is the same.
+    """
+    if HAS_ORJSON and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        result: bytes = orjson.dumps(data, default=default, option=option)
+        return result.decode()
+    return json.dumps(data, indent=indent, default=default)
+
+
 class OutputAdapter(ABC):
     """Base class for output adapters."""
 
@@ -6,10 +6,9 @@ Renders findings as JSON for machine processing.
 
 from __future__ import annotations
 
-import json
 from typing import TYPE_CHECKING, Any, TextIO
 
-from datev_lint.cli.output.base import OutputAdapter, OutputFormat
+from datev_lint.cli.output.base import OutputAdapter, OutputFormat, dump_json
 
 if TYPE_CHECKING:
     from datev_lint.core.fix.models import PatchPlan
@@ -22,7 +21,7 @@ class JsonOutput(OutputAdapter):
 
     format = OutputFormat.JSON
 
-    def __init__(self, stream: TextIO | None = None, color: bool = False, indent: int = 2):
+    def __init__(self, stream: TextIO | None = None, color: bool = False, indent: int | None = 2):
         del color  # JSON is never colorized.
         super().__init__(stream=stream, color=False)
         self.indent = indent
@@ -40,7 +39,7 @@ class JsonOutput(OutputAdapter):
         if summary:
             output["summary"] = self._summary_to_dict(summary)
 
-        return json.dumps(output, indent=self.indent, default=str)
+        return dump_json(output, self.indent, default=str)
 
     def render_result(self, result: PipelineResult) -> str:
         """Render pipeline result as JSON."""
@@ -84,7 +83,7 @@ class JsonOutput(OutputAdapter):
             },
         }
 
-        return json.dumps(output, indent=self.indent)
+        return dump_json(output, self.indent)
 
     def _finding_to_dict(self, finding: Finding) -> dict[str, Any]:
         """Convert finding to dictionary."""
@@ -6,7 +6,6 @@ Renders findings as JUnit XML for CI systems.
 
 from __future__ import annotations
 
-import xml.etree.ElementTree as ET
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, TextIO
 
@@ -17,6 +16,38 @@ if TYPE_CHECKING:
     from datev_lint.core.rules.pipeline import PipelineResult
 
 
+# Escapes as written by xml.etree.ElementTree
+_TEXT_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+_ATTR_ESCAPES = str.maketrans(
+    {
+        "&": "&amp;",
+        "<": "&lt;",
+        ">": "&gt;",
+        '"': "&quot;",
+        "\r": "&#13;",
+        "\n": "&#10;",
+        "\t": "&#09;",
+    }
+)
+
+_XML_DECLARATION = "<?xml version='1.0' encoding='utf-8'?>"
+
+# Result element per severity: (tag, counter)
+_RESULT_ELEMENTS = {
+    "fatal": ("error", "errors"),
+    "error": ("failure", "failures"),
+    "warn": ("failure", "failures"),
+}
+
+
+def _text(value: str) -> str:
+    return value.translate(_TEXT_ESCAPES)
+
+
+def _attr(value: str) -> str:
+    return value.translate(_ATTR_ESCAPES)
+
+
 def _location_label(finding: Finding) -> str:
     parts: list[str] = []
     if finding.location.row_no is not None:
@@ -57,87 +88,46 @@ class JunitOutput(OutputAdapter):
         findings: list[Finding],
         summary: ValidationSummary | None = None,
     ) -> str:
-        failures = 0
-        errors = 0
-        skipped = 0
-
-        testsuite = ET.Element(
-            "testsuite",
-            {
-                "name": "datev-lint",
-                "timestamp": datetime.now(UTC).isoformat(),
-            },
-        )
+        counts = {"failures": 0, "errors": 0, "skipped": 0}
+        parts: list[str] = []
 
         if summary:
-            properties = ET.SubElement(testsuite, "properties")
-            ET.SubElement(properties, "property", {"name": "file", "value": summary.file})
-            ET.SubElement(
-                properties, "property", {"name": "encoding", "value": str(summary.encoding)}
-            )
-            ET.SubElement(
-                properties, "property", {"name": "row_count", "value": str(summary.row_count)}
-            )
-            ET.SubElement(
-                properties,
-                "property",
-                {"name": "engine_version", "value": str(summary.engine_version)},
-            )
+            parts.append("  <properties>")
+            for name, value in (
+                ("file", summary.file),
+                ("encoding", str(summary.encoding)),
+                ("row_count", str(summary.row_count)),
+                ("engine_version", str(summary.engine_version)),
+            ):
+                parts.append(f'    <property name="{name}" value="{_attr(value)}" />')
+            parts.append("  </properties>")
 
         if not findings:
-            ET.SubElement(
-                testsuite,
-                "testcase",
-                {
-                    "classname": "datev-lint",
-                    "name": "validate",
-                },
+            parts.append('  <testcase classname="datev-lint" name="validate" />')
+
+        for finding in findings:
+            file_name = finding.location.file or "<unknown>"
+            name = f"{finding.code} {_location_label(finding)}".strip()
+            severity = finding.severity.value
+            message = _attr(finding.message)
+
+            tag, counter = _RESULT_ELEMENTS.get(severity, ("skipped", "skipped"))
+            counts[counter] += 1
+            type_attr = "" if tag == "skipped" else f' type="{severity}"'
+
+            parts.append(f'  <testcase classname="{_attr(file_name)}" name="{_attr(name)}">')
+            parts.append(
+                f'    <{tag} message="{message}"{type_attr}>{_text(_details(finding))}</{tag}>'
             )
-        else:
-            for finding in findings:
-                file_name = finding.location.file or "<unknown>"
-                location = _location_label(finding)
-                name = f"{finding.code} {location}".strip()
-
-                testcase = ET.SubElement(
-                    testsuite,
-                    "testcase",
-                    {
-                        "classname": file_name,
-                        "name": name,
-                    },
-                )
-
-                details = _details(finding)
-                severity = finding.severity.value
-
-                if severity == "fatal":
-                    errors += 1
-                    element = ET.SubElement(
-                        testcase, "error", {"message": finding.message, "type": severity}
-                    )
-                    element.text = details
-                elif severity in {"error", "warn"}:
-                    failures += 1
-                    element = ET.SubElement(
-                        testcase, "failure", {"message": finding.message, "type": severity}
-                    )
-                    element.text = details
-                else:
-                    skipped += 1
-                    element = ET.SubElement(testcase, "skipped", {"message": finding.message})
-                    element.text = details
-
-        testsuite.set("tests", str(len(testsuite.findall("testcase"))))
-        testsuite.set("failures", str(failures))
-        testsuite.set("errors", str(errors))
-        testsuite.set("skipped", str(skipped))
-
-        ET.indent(testsuite, space="  ")
-        xml_bytes: bytes | str = ET.tostring(testsuite, encoding="utf-8", xml_declaration=True)
-        if isinstance(xml_bytes, bytes):
-            return xml_bytes.decode("utf-8")
-        return xml_bytes
+            parts.append("  </testcase>")
+
+        timestamp = datetime.now(UTC).isoformat()
+        header = (
+            f'<testsuite name="datev-lint" timestamp="{timestamp}"'
+            f' tests="{len(findings) or 1}" failures="{counts["failures"]}"'
+            f' errors="{counts["errors"]}" skipped="{counts["skipped"]}">'
+        )
+        return "\n".join([_XML_DECLARATION, header, *parts, "</testsuite>"])
 
     def render_result(self, result: PipelineResult) -> str:
         """Render pipeline result as JUnit XML."""
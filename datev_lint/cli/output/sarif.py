@@ -6,10 +6,9 @@ Renders findings as SARIF 2.1.0 for GitHub Code Scanning.
 
 from __future__ import annotations
 
-import json
 from typing import TYPE_CHECKING, Any, TextIO
 
-from datev_lint.cli.output.base import OutputAdapter, OutputFormat
+from datev_lint.cli.output.base import OutputAdapter, OutputFormat, dump_json
 
 if TYPE_CHECKING:
     from datev_lint.core.rules.models import Finding, ValidationSummary
@@ -33,7 +32,7 @@ class SarifOutput(OutputAdapter):
     SARIF_VERSION = "2.1.0"
     SARIF_SCHEMA = "https://raw.githubusercontent.com/oasis-tcs/sarif-spec/master/Schemata/sarif-schema-2.1.0.json"
 
-    def __init__(self, stream: TextIO | None = None, color: bool = False, indent: int = 2):
+    def __init__(self, stream: TextIO | None = None, color: bool = False, indent: int | None = 2):
         del color  # SARIF is never colorized.
         super().__init__(stream=stream, color=False)
         self.indent = indent
@@ -70,7 +69,7 @@ class SarifOutput(OutputAdapter):
             ],
         }
 
-        return json.dumps(sarif, indent=self.indent)
+        return dump_json(sarif, self.indent)
 
     def render_result(self, result: PipelineResult) -> str:
         """Render pipeline result as SARIF."""
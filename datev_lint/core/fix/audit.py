@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import re
 import uuid
 from datetime import UTC, datetime
@@ -22,11 +23,36 @@ from datev_lint.core.fix.models import (
     WriteResult,
 )
 
+# Try to import orjson, fall back to the stdlib encoder
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
 _RUN_ID_PATTERN = re.compile(r"^[0-9a-fA-F-]{1,64}$")
 
 
+def _dump_entry_data(data: dict[str, Any]) -> bytes:
+    """Serialize an audit entry dict as indented UTF-8 JSON."""
+    if HAS_ORJSON:
+        result: bytes = orjson.dumps(
+            data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        )
+        return result
+    return json.dumps(data, indent=2, default=str).encode("utf-8")
+
+
+def _load_entry_data(raw: bytes) -> Any:
+    """Parse audit entry JSON written by _dump_entry_data()."""
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def _validate_run_id(run_id: str) -> str:
     run_id = run_id.strip()
     if not _RUN_ID_PATTERN.fullmatch(run_id):
@@ -174,8 +200,7 @@ class AuditLogger:
         if not entry_path.exists():
             return None
 
-        with entry_path.open(encoding="utf-8") as f:
-            data = json.load(f)
+        data = _load_entry_data(entry_path.read_bytes())
 
         return self._dict_to_entry(data)
 
@@ -196,14 +221,23 @@ class AuditLogger:
         """
         entries: list[AuditEntry] = []
 
-        for path in sorted(self.audit_dir.glob("*.json"), reverse=True):
+        # One scandir pass; DirEntry.is_file() reuses the d_type from readdir
+        with os.scandir(self.audit_dir) as it:
+            names = [
+                entry.name
+                for entry in it
+                if entry.name.endswith(".json")
+                and not entry.name.startswith(".")
+                and entry.is_file()
+            ]
+
+        for name in sorted(names, reverse=True):
             if len(entries) >= limit:
                 break
 
+            path = self.audit_dir / name
             try:
-                with path.open(encoding="utf-8") as f:
-                    data = json.load(f)
-                entry = self._dict_to_entry(data)
+                entry = self._dict_to_entry(_load_entry_data(path.read_bytes()))
             except (OSError, json.JSONDecodeError, KeyError, TypeError, ValueError):
                 logger.warning("Failed to read audit entry: %s", path, exc_info=True)
             else:
@@ -223,8 +257,7 @@ class AuditLogger:
 
         data = self._entry_to_dict(entry)
 
-        with entry_path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, default=str)
+        entry_path.write_bytes(_dump_entry_data(data))
 
     def _entry_to_dict(self, entry: AuditEntry) -> dict[str, Any]:
         """Convert audit entry to dictionary."""
@@ -15,6 +15,14 @@ if TYPE_CHECKING:
     from collections.abc import Iterator
 
 
+def _group_by_location(patches: list[Patch]) -> dict[tuple[int, str], list[Patch]]:
+    """Group patches by (row_no, field) in a single pass, keeping input order."""
+    by_location: dict[tuple[int, str], list[Patch]] = defaultdict(list)
+    for patch in patches:
+        by_location[(patch.row_no, patch.field)].append(patch)
+    return by_location
+
+
 class ConflictDetector:
     """Detects conflicts between patches."""
 
@@ -33,17 +41,10 @@ class ConflictDetector:
         Returns:
             List of detected conflicts
         """
-        # Group by (row_no, field)
-        by_location: dict[tuple[int, str], list[Patch]] = defaultdict(list)
-
-        for patch in patches:
-            key = (patch.row_no, patch.field)
-            by_location[key].append(patch)
-
         # Find conflicts
         conflicts: list[Conflict] = []
 
-        for (row_no, field), patch_list in by_location.items():
+        for (row_no, field), patch_list in _group_by_location(patches).items():
             if len(patch_list) > 1:
                 # Determine selected patch based on resolution strategy
                 if self.resolution == ConflictResolution.FIRST_WINS:
@@ -84,9 +85,10 @@ class ConflictDetector:
                 for patch in conflict.patches:
                     excluded.add(id(patch))
             else:
-                # Exclude non-selected patches
+                # Exclude non-selected patches (by identity: equal duplicates
+                # are still distinct patches)
                 for patch in conflict.patches:
-                    if patch != conflict.selected_patch:
+                    if patch is not conflict.selected_patch:
                         excluded.add(id(patch))
 
         return [p for p in patches if id(p) not in excluded]
@@ -119,11 +121,6 @@ def iter_conflict_groups(patches: list[Patch]) -> Iterator[tuple[int, str, list[
     Yields:
         Tuples of (row_no, field, patches)
     """
-    by_location: dict[tuple[int, str], list[Patch]] = defaultdict(list)
-
-    for patch in patches:
-        by_location[(patch.row_no, patch.field)].append(patch)
-
-    for (row_no, field), patch_list in by_location.items():
+    for (row_no, field), patch_list in _group_by_location(patches).items():
         if len(patch_list) > 1:
             yield row_no, field, patch_list
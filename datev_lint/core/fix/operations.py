@@ -9,6 +9,7 @@ from __future__ import annotations
 import re
 from abc import ABC, abstractmethod
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 from typing import Any, ClassVar
 
 from datev_lint.core.fix.models import OperationContext, PatchOperation
@@ -56,6 +57,12 @@ class TruncateOperation(Operation):
         return value[:max_length]
 
 
+@lru_cache(maxsize=128)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a charset pattern once; skips re's cache lookup per cell."""
+    return re.compile(pattern)
+
+
 class SanitizeCharsOperation(Operation):
     """Remove or replace invalid characters."""
 
@@ -67,7 +74,7 @@ class SanitizeCharsOperation(Operation):
             return value
 
         # Pattern specifies invalid characters to remove
-        return re.sub(pattern, replacement, value)
+        return _compile_pattern(pattern).sub(replacement, value)
 
 
 class NormalizeDecimalOperation(Operation):
@@ -82,13 +89,8 @@ class NormalizeDecimalOperation(Operation):
 
         try:
             decimal_value = Decimal(normalized)
-            # Format with comma as decimal separator (German format)
-            formatted = f"{decimal_value:,.2f}"
-            # Convert to German format: swap comma and dot
-            formatted = formatted.replace(",", "_").replace(".", ",").replace("_", ".")
-            # Remove thousand separators for DATEV
-            formatted = formatted.replace(".", "")
-            return formatted
+            # Two decimals with comma separator, no thousand separators (DATEV)
+            return f"{decimal_value:.2f}".replace(".", ",")
         except InvalidOperation:
             # Return original if not a valid number
             return value
@@ -122,9 +124,11 @@ class OperationRegistry:
     @classmethod
     def get(cls, operation: PatchOperation) -> Operation:
         """Get operation handler."""
-        if operation not in cls._operations:
+        # Single lookup: Enum.__hash__ is a Python-level method
+        handler = cls._operations.get(operation)
+        if handler is None:
             raise ValueError(f"Unknown operation: {operation}")
-        return cls._operations[operation]
+        return handler
 
     @classmethod
     def apply(
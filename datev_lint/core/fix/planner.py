@@ -7,7 +7,7 @@ Generates PatchPlan from validation findings with fix candidates.
 from __future__ import annotations
 
 import hashlib
-from collections import defaultdict
+from collections import Counter, defaultdict
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -23,15 +23,15 @@ from datev_lint.core.rules.models import Finding, RiskLevel
 if TYPE_CHECKING:
     from datev_lint.core.rules.pipeline import PipelineResult
 
+# Fix candidate operation names, resolved without PatchOperation(...) calls
+_OPERATIONS_BY_VALUE = {operation.value: operation for operation in PatchOperation}
+
 
 def compute_file_checksum(file_path: str | Path) -> str:
     """Compute SHA-256 checksum of a file."""
-    file_path = Path(file_path)
-    sha256 = hashlib.sha256()
-    with file_path.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256.update(chunk)
-    return sha256.hexdigest()
+    # file_digest reads into its own buffer; a BufferedReader would only add a copy
+    with Path(file_path).open("rb", buffering=0) as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 def compute_bytes_checksum(data: bytes) -> str:
@@ -71,19 +71,19 @@ class PatchPlanner:
         # Extract patches from fix candidates
         patches: list[Patch] = []
         for finding in findings:
+            row_no = finding.location.row_no
+            if row_no is None or not finding.fix_candidates:
+                # Skip findings without row location or fix
+                continue
+
             for candidate in finding.fix_candidates:
-                try:
-                    operation = PatchOperation(candidate.operation)
-                except ValueError:
+                operation = _OPERATIONS_BY_VALUE.get(candidate.operation)
+                if operation is None:
                     # Skip unknown operations
                     continue
 
-                if finding.location.row_no is None:
-                    # Skip findings without row location
-                    continue
-
                 patch = Patch(
-                    row_no=finding.location.row_no,
+                    row_no=row_no,
                     field=candidate.field,
                     operation=operation,
                     old_value=candidate.old_value,
@@ -105,9 +105,7 @@ class PatchPlanner:
         resolved_patches = self._resolve_conflicts(patches, conflicts)
 
         # Count by risk level
-        low_count = sum(1 for p in resolved_patches if p.risk == RiskLevel.LOW)
-        medium_count = sum(1 for p in resolved_patches if p.risk == RiskLevel.MEDIUM)
-        high_count = sum(1 for p in resolved_patches if p.risk == RiskLevel.HIGH)
+        risk_counts = Counter(p.risk for p in resolved_patches)
 
         # Check if approval required
         requires_approval = any(p.requires_approval for p in resolved_patches)
@@ -117,9 +115,9 @@ class PatchPlanner:
             file_checksum=file_checksum,
             patches=resolved_patches,
             conflicts=conflicts,
-            low_risk_count=low_count,
-            medium_risk_count=medium_count,
-            high_risk_count=high_count,
+            low_risk_count=risk_counts[RiskLevel.LOW],
+            medium_risk_count=risk_counts[RiskLevel.MEDIUM],
+            high_risk_count=risk_counts[RiskLevel.HIGH],
             requires_approval=requires_approval,
         )
 
@@ -158,15 +156,17 @@ class PatchPlanner:
         conflicts: list[Conflict],
     ) -> list[Patch]:
         """Filter patches based on conflict resolution."""
-        # Build set of patches to exclude due to conflicts
-        excluded: set[Patch] = set()
+        # Build set of patches to exclude due to conflicts (by identity:
+        # hashing frozen models hashes every field, and equal duplicates
+        # are still distinct patches)
+        excluded: set[int] = set()
 
         for conflict in conflicts:
             for patch in conflict.patches:
-                if patch != conflict.selected_patch:
-                    excluded.add(patch)
+                if patch is not conflict.selected_patch:
+                    excluded.add(id(patch))
 
-        return [p for p in patches if p not in excluded]
+        return [p for p in patches if id(p) not in excluded]
 
 
 def plan_fixes(
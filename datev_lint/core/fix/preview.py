@@ -16,7 +16,15 @@ if TYPE_CHECKING:
     from datev_lint.core.fix.models import Patch, PatchPlan
 
 
-@dataclass
+# Risk indicators: (plain, colorized)
+_RISK_SYMBOLS: dict[RiskLevel, tuple[str, str]] = {
+    RiskLevel.LOW: ("[low]", "\033[32m[low]\033[0m"),
+    RiskLevel.MEDIUM: ("[medium]", "\033[33m[medium]\033[0m"),
+    RiskLevel.HIGH: ("[HIGH]", "\033[31m[HIGH]\033[0m"),
+}
+
+
+@dataclass(slots=True)
 class DiffLine:
     """Single line in a diff output."""
 
@@ -28,7 +36,7 @@ class DiffLine:
     risk: RiskLevel
 
 
-@dataclass
+@dataclass(slots=True)
 class DiffOutput:
     """Complete diff output for a patch plan."""
 
@@ -112,10 +120,14 @@ class DiffGenerator:
             old_display = self._format_value(line.old_value, is_old=True)
             new_display = self._format_value(line.new_value, is_old=False)
 
-            lines.append(f"  {line.field}: {risk_indicator}")
-            lines.append(f"    - {old_display}")
-            lines.append(f"    + {new_display}")
-            lines.append(f"    ({line.rule_id})")
+            lines.extend(
+                (
+                    f"  {line.field}: {risk_indicator}",
+                    f"    - {old_display}",
+                    f"    + {new_display}",
+                    f"    ({line.rule_id})",
+                )
+            )
 
         # Summary
         lines.append("")
@@ -125,12 +137,8 @@ class DiffGenerator:
 
     def _risk_symbol(self, risk: RiskLevel) -> str:
         """Get risk level symbol."""
-        if risk == RiskLevel.LOW:
-            return "[low]" if not self.colorize else "\033[32m[low]\033[0m"
-        elif risk == RiskLevel.MEDIUM:
-            return "[medium]" if not self.colorize else "\033[33m[medium]\033[0m"
-        else:
-            return "[HIGH]" if not self.colorize else "\033[31m[HIGH]\033[0m"
+        plain, colored = _RISK_SYMBOLS.get(risk, _RISK_SYMBOLS[RiskLevel.HIGH])
+        return colored if self.colorize else plain
 
     def _format_value(self, value: str, is_old: bool) -> str:
         """Format value for display."""
@@ -20,6 +20,13 @@ OPERATION_RISK: dict[PatchOperation, RiskLevel] = {
     PatchOperation.SPLIT_FILE: RiskLevel.MEDIUM,
 }
 
+# Risk levels in ascending order of severity
+RISK_ORDER: dict[RiskLevel, int] = {
+    RiskLevel.LOW: 0,
+    RiskLevel.MEDIUM: 1,
+    RiskLevel.HIGH: 2,
+}
+
 
 def get_operation_risk(operation: PatchOperation) -> RiskLevel:
     """Get risk level for an operation."""
@@ -37,14 +44,8 @@ def should_apply(patch: Patch, accept_risk: RiskLevel) -> bool:
     Returns:
         True if patch should be applied
     """
-    risk_order = {
-        RiskLevel.LOW: 0,
-        RiskLevel.MEDIUM: 1,
-        RiskLevel.HIGH: 2,
-    }
-
-    patch_level = risk_order.get(patch.risk, 1)
-    accept_level = risk_order.get(accept_risk, 1)
+    patch_level = RISK_ORDER.get(patch.risk, 1)
+    accept_level = RISK_ORDER.get(accept_risk, 1)
 
     # If patch requires approval, always return False unless explicitly accepted
     if patch.requires_approval and accept_risk != RiskLevel.HIGH:
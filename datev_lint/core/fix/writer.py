@@ -259,7 +259,7 @@ class CanonicalWriter(Writer):
             patches_by_row[patch.row_no].append(patch)
 
         # Write data rows (row 3+)
-        for row in parse_result.rows:
+        for row in parse_result.booking_rows:
             row_no = row.row_no
             tokens = list(row.raw_tokens)
 
@@ -9,6 +9,7 @@ from __future__ import annotations
 import base64
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -31,6 +32,24 @@ class VerificationError(Exception):
     pass
 
 
+@lru_cache(maxsize=32)
+def _read_public_key(
+    path: str,
+    file_id: tuple[int, int, int, int],  # noqa: ARG001
+) -> Ed25519PublicKey:
+    """
+    Parse an Ed25519 public key from a PEM file.
+
+    Cached per resolved path and (inode, size, mtime, ctime) so repeated
+    verifiers reuse the parsed key, while a replaced key file is picked up
+    again even if its mtime was preserved.
+    """
+    key = load_pem_public_key(Path(path).read_bytes())
+    if not isinstance(key, Ed25519PublicKey):
+        raise VerificationError("Public key is not an Ed25519 key")
+    return key
+
+
 class LicenseVerifier:
     """Verifies Ed25519 signatures on license files."""
 
@@ -68,11 +87,11 @@ class LicenseVerifier:
             return
 
         try:
-            key_data = path.read_bytes()
-            key = load_pem_public_key(key_data)
-            if not isinstance(key, Ed25519PublicKey):
-                raise VerificationError("Public key is not an Ed25519 key")
-            self._public_key = key
+            resolved = path.resolve()
+            st = resolved.stat()
+            self._public_key = _read_public_key(
+                str(resolved), (st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+            )
         except Exception as e:
             raise VerificationError(f"Failed to load public key: {e}") from e
 
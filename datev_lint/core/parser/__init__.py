@@ -24,6 +24,7 @@ API Functions:
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING, BinaryIO
 
@@ -86,13 +87,12 @@ def parse_bytes_from_path(path: Path, *, max_bytes: int | None = None) -> ParseR
     """
     if max_bytes is not None and max_bytes > 0:
         with path.open("rb") as f:
-            data = f.read(max_bytes + 1)
-        if len(data) > max_bytes:
-            file_size: int | None
-            try:
-                file_size = path.stat().st_size
-            except OSError:
-                file_size = None
+            # Regular files report their size up front, so oversized files
+            # are rejected without reading max_bytes of data first.
+            file_size = os.fstat(f.fileno()).st_size
+            oversized = file_size > max_bytes
+            data = b"" if oversized else f.read(max_bytes + 1)
+        if oversized or len(data) > max_bytes:
             return _create_error_result(
                 filename=str(path),
                 encoding="<unknown>",
@@ -107,7 +107,10 @@ def parse_bytes_from_path(path: Path, *, max_bytes: int | None = None) -> ParseR
             )
         return parse_bytes(data, str(path), max_bytes=max_bytes)
 
-    data = path.read_bytes()
+    # Unbuffered: the whole file is read at once, so a BufferedReader only
+    # adds an allocation and the lseek/isatty calls made when it is set up.
+    with path.open("rb", buffering=0) as raw:
+        data = raw.readall()
     return parse_bytes(data, str(path), max_bytes=None)
 
 
@@ -193,8 +196,8 @@ def parse_bytes(
     header_errors.extend(column_errors)
 
     # Step 7: Create row factory for streaming
-    def row_factory() -> Iterator[BookingRow | ParserError]:
-        """Create an iterator over data rows."""
+    def row_factory(include_errors: bool = True) -> Iterator[BookingRow | ParserError]:
+        """Create an iterator over data rows (and row errors unless disabled)."""
         row_no = 3  # Data rows start at line 3
 
         # Re-tokenize from the start to keep the iterator reusable.
@@ -218,7 +221,8 @@ def parse_bytes(
             )
 
             # Yield errors
-            yield from row_errors
+            if include_errors:
+                yield from row_errors
 
             # Yield row if successfully parsed
             if row is not None:
@@ -228,6 +232,8 @@ def parse_bytes(
 
             # Check row limit (99,999)
             if row_no > 99_999 + 2:
+                if not include_errors:
+                    break
                 yield ParserError.warn(
                     code="DVL-ROW-001",
                     title="Row limit exceeded",
@@ -283,7 +289,7 @@ def _create_error_result(
         raw_tokens=[],
     )
 
-    def empty_row_factory() -> Iterator[BookingRow | ParserError]:
+    def empty_row_factory(_include_errors: bool = True) -> Iterator[BookingRow | ParserError]:
         """Empty row factory."""
         return iter([])
 
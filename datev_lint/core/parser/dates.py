@@ -10,6 +10,7 @@ This module implements the year derivation algorithm with confidence levels.
 from __future__ import annotations
 
 from datetime import date
+from functools import lru_cache
 
 from .models import DateConfidence, DerivedDate
 
@@ -43,6 +44,19 @@ def derive_year(
     Returns:
         DerivedDate with year and confidence level
     """
+    return _derive_year_cached(ttmm, fiscal_year_start, period_from, period_to)
+
+
+# Rows of a file share the header dates and repeat a few hundred TTMM
+# values at most, and DerivedDate is frozen, so results are shared.
+@lru_cache(maxsize=1024)
+def _derive_year_cached(
+    ttmm: str,
+    fiscal_year_start: date | None,
+    period_from: date | None,
+    period_to: date | None,
+) -> DerivedDate:
+    """Derive year for TTMM date format (see derive_year)."""
     # Parse day and month
     if not ttmm or len(ttmm) != 4 or not ttmm.isdigit():
         return DerivedDate(
@@ -55,8 +69,10 @@ def derive_year(
             warning_code="DVL-DATE-001",
         )
 
-    day = int(ttmm[:2])
-    month = int(ttmm[2:4])
+    # One int() on all four digits instead of two slices and two parses
+    day_month = int(ttmm)
+    day = day_month // 100
+    month = day_month % 100
 
     # Validate day and month ranges
     if not (1 <= day <= 31) or not (1 <= month <= 12):
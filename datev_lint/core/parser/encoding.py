@@ -6,12 +6,13 @@ DATEV files can be encoded in:
 - UTF-8 without BOM
 - Windows-1252 (legacy)
 
-This module provides robust encoding detection using charset-normalizer.
+Only these three occur in practice, so detection is a BOM check plus a
+UTF-8 decode trial; no statistical detector is needed.
 """
 
 from __future__ import annotations
 
-from charset_normalizer import from_bytes
+import codecs
 
 # Size of data to use for encoding detection (8KB is usually sufficient)
 DETECTION_SAMPLE_SIZE = 8192
@@ -23,7 +24,7 @@ def detect_encoding(data: bytes) -> str:
 
     Detection priority:
     1. UTF-8 BOM (explicit marker)
-    2. charset-normalizer detection
+    2. Pure ASCII or valid UTF-8 in the sample
     3. Fallback to Windows-1252
 
     Args:
@@ -41,30 +42,19 @@ def detect_encoding(data: bytes) -> str:
         # UTF-16 is not typical for DATEV, but handle it
         return "utf-16"
 
-    # Use charset-normalizer for detection
-    results = from_bytes(data[:DETECTION_SAMPLE_SIZE])
+    sample = data[:DETECTION_SAMPLE_SIZE]
 
-    if results:
-        best = results.best()
-        if best is not None:
-            encoding = best.encoding.lower()
-
-            # Normalize encoding names
-            if encoding in ("ascii", "utf-8", "utf8"):
-                return "utf-8"
-
-            if encoding in ("cp1252", "windows-1252", "latin-1", "iso-8859-1"):
-                return "windows-1252"
-
-            # Return detected encoding for other cases
-            return encoding
+    # Pure ASCII (the usual DATEV header and columns) is valid UTF-8
+    if sample.isascii():
+        return "utf-8"
 
-    # Fallback: try to decode as UTF-8, fall back to Windows-1252
+    # A multi-byte character may be cut at the end of a truncated sample
+    decoder = codecs.getincrementaldecoder("utf-8")()
     try:
-        data[:DETECTION_SAMPLE_SIZE].decode("utf-8")
-        return "utf-8"
+        decoder.decode(sample, final=len(data) <= DETECTION_SAMPLE_SIZE)
     except UnicodeDecodeError:
         return "windows-1252"
+    return "utf-8"
 
 
 def decode_with_fallback(data: bytes, encoding: str) -> str:
@@ -363,7 +363,10 @@ class ParseResult(BaseModel):
     row_factory_fn: Any = Field(
         exclude=True,
         repr=False,
-        description="Factory function for creating row iterator",
+        description=(
+            "Factory function for creating row iterator; may accept "
+            "include_errors: bool = True to skip row-level ParserErrors"
+        ),
     )
 
     # Collected errors during header/column parsing
@@ -382,6 +385,20 @@ class ParseResult(BaseModel):
         """
         return self.row_factory_fn()  # type: ignore[no-any-return]
 
+    @property
+    def booking_rows(self) -> Iterator[BookingRow]:
+        """
+        Iterate over successfully parsed booking rows only.
+
+        Row-level ParserErrors are not produced, so consumers that only need
+        rows can skip per-item type checks. Factories that do not accept
+        include_errors fall back to filtering rows.
+        """
+        try:
+            return self.row_factory_fn(include_errors=False)  # type: ignore[no-any-return]
+        except TypeError:
+            return (item for item in self.row_factory_fn() if isinstance(item, BookingRow))
+
     def materialize(self) -> tuple[list[BookingRow], list[Any]]:
         """
         Materialize all rows into memory.
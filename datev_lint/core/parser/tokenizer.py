@@ -7,13 +7,22 @@ DATEV files use a specific CSV dialect:
 - Escape: doubled quotes ("")
 - Line terminator: CR (\r), with LF allowed inside quoted fields
 
-This module implements a streaming state-machine tokenizer that handles
-all these edge cases correctly.
+Records are read with the C csv reader where the dialect allows it, and
+otherwise (and for single lines) each field is scanned with one
+precompiled regular expression, so the per-character work never runs in a
+Python loop. Both handle all these edge cases the same way:
+- a quoted field ends at the first quote not doubled; anything after it
+  up to the next delimiter is kept verbatim
+- an unclosed quote runs to the end of the input
+- quotes inside unquoted fields are literal
 """
 
 from __future__ import annotations
 
-from enum import Enum, auto
+import csv
+import io
+import re
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from .models import Dialect
@@ -21,14 +30,7 @@ from .models import Dialect
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
-
-class TokenizerState(Enum):
-    """State of the tokenizer state machine."""
-
-    FIELD_START = auto()  # At start of a field
-    IN_UNQUOTED = auto()  # Inside an unquoted field
-    IN_QUOTED = auto()  # Inside a quoted field
-    QUOTE_IN_QUOTED = auto()  # Just saw a quote inside a quoted field
+_DEFAULT_DIALECT = Dialect()
 
 
 class TokenizerError(Exception):
@@ -41,6 +43,31 @@ class TokenizerError(Exception):
         super().__init__(f"Line {line}, column {column}: {message}")
 
 
+@lru_cache(maxsize=8)
+def _field_pattern(delimiter: str, quotechar: str, newlines: bool) -> re.Pattern[str]:
+    """
+    Compile the pattern matching one field and the terminator after it.
+
+    Groups: (opening quote, quoted body, text after the closing quote,
+    unquoted value, terminator). The quoted body is possessive, so a doubled
+    quote is never split to find a later closing quote. The terminator is
+    empty only at the end of the input.
+
+    Args:
+        delimiter: Field delimiter
+        quotechar: Quote character
+        newlines: Whether CR, LF and CRLF outside quotes end a record
+    """
+    d = re.escape(delimiter)
+    q = re.escape(quotechar)
+    stop = d + "\\r\\n" if newlines else d
+    terminator = f"{d}|\\r\\n|\\r|\\n" if newlines else d
+    return re.compile(
+        rf"(?:({q})((?:[^{q}]|{q}{q})*+)(?:{q}([^{stop}]*)|\Z)|([^{stop}{q}][^{stop}]*|))"
+        rf"({terminator}|\Z)"
+    )
+
+
 def tokenize_line(
     line: str,
     dialect: Dialect | None = None,
@@ -59,66 +86,23 @@ def tokenize_line(
         List of field values (unquoted and unescaped)
     """
     if dialect is None:
-        dialect = Dialect()
+        dialect = _DEFAULT_DIALECT
 
     delimiter = dialect.delimiter
     quotechar = dialect.quotechar
+    if quotechar not in line:
+        return line.split(delimiter)
 
+    escaped_quote = quotechar * 2
     fields: list[str] = []
-    field_buffer: list[str] = []
-    state = TokenizerState.FIELD_START
-    i = 0
-
-    while i < len(line):
-        char = line[i]
-
-        if state == TokenizerState.FIELD_START:
-            if char == quotechar:
-                state = TokenizerState.IN_QUOTED
-            elif char == delimiter:
-                fields.append("")
-            else:
-                field_buffer.append(char)
-                state = TokenizerState.IN_UNQUOTED
-
-        elif state == TokenizerState.IN_UNQUOTED:
-            if char == delimiter:
-                fields.append("".join(field_buffer))
-                field_buffer = []
-                state = TokenizerState.FIELD_START
-            else:
-                field_buffer.append(char)
-
-        elif state == TokenizerState.IN_QUOTED:
-            if char == quotechar:
-                state = TokenizerState.QUOTE_IN_QUOTED
-            else:
-                field_buffer.append(char)
-
-        elif state == TokenizerState.QUOTE_IN_QUOTED:
-            if char == quotechar:
-                # Escaped quote
-                field_buffer.append(quotechar)
-                state = TokenizerState.IN_QUOTED
-            elif char == delimiter:
-                fields.append("".join(field_buffer))
-                field_buffer = []
-                state = TokenizerState.FIELD_START
-            else:
-                # Quote ended, but there's more content
-                field_buffer.append(char)
-                state = TokenizerState.IN_UNQUOTED
-
-        i += 1
-
-    # Handle final field
-    if state == TokenizerState.IN_QUOTED:
-        # Unclosed quote - still capture the field
-        fields.append("".join(field_buffer))
-    elif state == TokenizerState.QUOTE_IN_QUOTED:
-        fields.append("".join(field_buffer))
-    else:
-        fields.append("".join(field_buffer))
+    pattern = _field_pattern(delimiter, quotechar, newlines=False)
+    for opening, body, tail, plain, terminator in pattern.findall(line):
+        if opening:
+            fields.append(body.replace(escaped_quote, quotechar) + tail)
+        else:
+            fields.append(plain)
+        if not terminator:
+            break
 
     return fields
 
@@ -142,103 +126,81 @@ def tokenize_stream(
         start_line and end_line are 1-indexed line numbers
     """
     if dialect is None:
-        dialect = Dialect()
+        dialect = _DEFAULT_DIALECT
+
+    if not _csv_compatible(dialect):
+        yield from _scan_stream(text, dialect)
+        return
+
+    # The C csv reader (non-strict) reads this dialect the same way as the
+    # field pattern; its line_num counts line breaks inside quotes too.
+    reader = csv.reader(
+        io.StringIO(text, newline=""),
+        delimiter=dialect.delimiter,
+        quotechar=dialect.quotechar,
+    )
+    line_no = 0
+    try:
+        for fields in reader:
+            # Skip blank lines
+            if any(fields):
+                yield fields, line_no + 1, reader.line_num
+            line_no = reader.line_num
+    except csv.Error:
+        # A field exceeded csv.field_size_limit(); scan the remaining records
+        for record in _scan_stream(text, dialect):
+            if record[1] > line_no:
+                yield record
+
+
+def _csv_compatible(dialect: Dialect) -> bool:
+    """Whether the csv module can read this dialect (single, distinct characters)."""
+    delimiter = dialect.delimiter
+    quotechar = dialect.quotechar
+    return (
+        len(delimiter) == 1
+        and len(quotechar) == 1
+        and delimiter != quotechar
+        and delimiter not in "\r\n"
+        and quotechar not in "\r\n"
+    )
+
 
+def _scan_stream(text: str, dialect: Dialect) -> Iterator[tuple[list[str], int, int]]:
+    """Tokenize records with the field pattern; see tokenize_stream()."""
     delimiter = dialect.delimiter
     quotechar = dialect.quotechar
+    escaped_quote = quotechar * 2
+    ends_with_break = text.endswith(("\r", "\n"))
 
     fields: list[str] = []
-    field_buffer: list[str] = []
-    state = TokenizerState.FIELD_START
-
     line_no = 1
     record_start_line = 1
 
-    def flush_record() -> Iterator[tuple[list[str], int, int]]:
-        """Flush the current record and reset buffers/state."""
-        nonlocal fields, field_buffer, state
-
-        fields.append("".join(field_buffer))
-        if fields and any(f for f in fields):
-            yield fields, record_start_line, line_no
-
-        fields = []
-        field_buffer = []
-        state = TokenizerState.FIELD_START
-
-    i = 0
-    while i < len(text):
-        char = text[i]
-        next_char = text[i + 1] if i + 1 < len(text) else None
-
-        # Handle line endings (CRLF/CR/LF). Outside quotes this terminates the record,
-        # inside quotes it's part of the field (DATEV allows embedded newlines).
-        if char == "\r" and next_char == "\n":
-            if state == TokenizerState.IN_QUOTED:
-                field_buffer.append("\r\n")
-            else:
-                yield from flush_record()
-            line_no += 1
-            if state != TokenizerState.IN_QUOTED:
-                record_start_line = line_no
-            i += 2
+    for match in _field_pattern(delimiter, quotechar, newlines=True).finditer(text):
+        opening, body, tail, plain, terminator = match.groups("")
+        if opening:
+            # Line breaks inside quotes belong to the field but still count
+            if "\r" in body or "\n" in body:
+                line_no += body.count("\r") + body.count("\n") - body.count("\r\n")
+                # ...except a final one in an unclosed quote: no line follows it
+                if not terminator and ends_with_break:
+                    line_no -= 1
+            fields.append(body.replace(escaped_quote, quotechar) + tail)
+        else:
+            fields.append(plain)
+
+        if terminator == delimiter:
             continue
 
-        if char in ("\r", "\n"):
-            if state == TokenizerState.IN_QUOTED:
-                field_buffer.append(char)
-            else:
-                yield from flush_record()
-            line_no += 1
-            if state != TokenizerState.IN_QUOTED:
-                record_start_line = line_no
-            i += 1
-            continue
-
-        if state == TokenizerState.FIELD_START:
-            if char == quotechar:
-                state = TokenizerState.IN_QUOTED
-            elif char == delimiter:
-                fields.append("")
-            else:
-                field_buffer.append(char)
-                state = TokenizerState.IN_UNQUOTED
-
-        elif state == TokenizerState.IN_UNQUOTED:
-            if char == delimiter:
-                fields.append("".join(field_buffer))
-                field_buffer = []
-                state = TokenizerState.FIELD_START
-            else:
-                field_buffer.append(char)
-
-        elif state == TokenizerState.IN_QUOTED:
-            if char == quotechar:
-                state = TokenizerState.QUOTE_IN_QUOTED
-            else:
-                field_buffer.append(char)
-
-        elif state == TokenizerState.QUOTE_IN_QUOTED:
-            if char == quotechar:
-                # Escaped quote
-                field_buffer.append(quotechar)
-                state = TokenizerState.IN_QUOTED
-            elif char == delimiter:
-                fields.append("".join(field_buffer))
-                field_buffer = []
-                state = TokenizerState.FIELD_START
-            else:
-                # Content after closing quote
-                field_buffer.append(char)
-                state = TokenizerState.IN_UNQUOTED
-
-        i += 1
-
-    # Handle final record if not empty
-    if field_buffer or fields:
-        fields.append("".join(field_buffer))
-        if fields and any(f for f in fields):
+        # End of record: skip blank lines
+        if any(fields):
             yield fields, record_start_line, line_no
+        if not terminator:
+            break
+        fields = []
+        line_no += 1
+        record_start_line = line_no
 
 
 def tokenize_bytes(
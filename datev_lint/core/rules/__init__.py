@@ -35,6 +35,7 @@ from .models import (
 )
 from .pipeline import ExecutionPipeline, PipelineResult
 from .registry import RuleRegistry, get_registry, reset_registry
+from .runner import run_files
 
 if TYPE_CHECKING:
     from datev_lint.core.parser import ParseResult
@@ -75,12 +76,7 @@ def get_validation_summary(
     """Create a validation summary from parse and pipeline results."""
     row_count = pipeline_result.row_count
     if row_count is None:
-        row_count = 0
-        for item in parse_result.rows:
-            from datev_lint.core.parser import ParserError
-
-            if not isinstance(item, ParserError):
-                row_count += 1
+        row_count = sum(1 for _ in parse_result.booking_rows)
 
     return pipeline_result.get_summary(
         file=str(parse_result.file_path),
@@ -113,6 +109,8 @@ __all__ = [
     "get_registry",
     "get_validation_summary",
     "reset_registry",
+    # Batch runner
+    "run_files",
     # Main function
     "validate",
 ]
@@ -8,12 +8,46 @@ from __future__ import annotations
 
 import re
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, ClassVar
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from .models import Constraint
 
 
+def _always_valid(_value: str) -> bool:
+    return True
+
+
+def _never_valid(_value: str) -> bool:
+    return False
+
+
+@lru_cache(maxsize=512)
+def _compile_regex(pattern: str) -> re.Pattern[str] | None:
+    """Compile a constraint pattern once; None if the pattern is invalid."""
+    try:
+        return re.compile(pattern)
+    except re.error:
+        return None
+
+
+def _regex_matches(pattern: str, value: str) -> bool:
+    regex = _compile_regex(pattern)
+    return regex is not None and regex.match(value) is not None
+
+
+def _compile_match(pattern: str) -> Callable[[str], bool]:
+    """Compile a pattern into a bool predicate; invalid patterns never match."""
+    regex = _compile_regex(pattern)
+    if regex is None:
+        return _never_valid
+    match = regex.match
+    return lambda value: match(value) is not None
+
+
 class ConstraintChecker(ABC):
     """Base class for constraint checkers."""
 
@@ -37,6 +71,22 @@ class ConstraintChecker(ABC):
         """Get error message for violation."""
         ...
 
+    def compile(self, constraint: Constraint) -> Callable[[str], bool]:
+        """
+        Specialize this checker for one constraint.
+
+        The returned predicate is equivalent to ``check(value, constraint, {})``
+        with the constraint parameters resolved up front. Subclasses override
+        this to avoid per-call dispatch and parameter lookups.
+        """
+        check = self.check
+        return lambda value: check(value, constraint, {})
+
+    def compile_message(self, constraint: Constraint, lang: str = "de") -> Callable[[str], str]:
+        """Bind constraint and language, returning a ``value -> message`` formatter."""
+        get_message = self.get_message
+        return lambda value: get_message(value, constraint, lang)
+
 
 class RegexConstraint(ConstraintChecker):
     """Check value against regex pattern."""
@@ -44,10 +94,12 @@ class RegexConstraint(ConstraintChecker):
     def check(self, value: str, constraint: Constraint, _context: dict[str, Any]) -> bool:
         if not constraint.pattern:
             return True
-        try:
-            return bool(re.match(constraint.pattern, value))
-        except re.error:
-            return False
+        return _regex_matches(constraint.pattern, value)
+
+    def compile(self, constraint: Constraint) -> Callable[[str], bool]:
+        if not constraint.pattern:
+            return _always_valid
+        return _compile_match(constraint.pattern)
 
     def get_message(self, value: str, constraint: Constraint, lang: str = "de") -> str:
         if lang == "de":
@@ -63,6 +115,12 @@ class MaxLengthConstraint(ConstraintChecker):
             return True
         return len(value) <= constraint.value
 
+    def compile(self, constraint: Constraint) -> Callable[[str], bool]:
+        max_len = constraint.value
+        if max_len is None:
+            return _always_valid
+        return lambda value: len(value) <= max_len
+
     def get_message(self, value: str, constraint: Constraint, lang: str = "de") -> str:
         if lang == "de":
             return f"Wert hat {len(value)} Zeichen, maximal {constraint.value} erlaubt"
@@ -77,6 +135,12 @@ class MinLengthConstraint(ConstraintChecker):
             return True
         return len(value) >= constraint.value
 
+    def compile(self, constraint: Constraint) -> Callable[[str], bool]:
+        min_len = constraint.value
+        if min_len is None:
+            return _always_valid
+        return lambda value: len(value) >= min_len
+
     def get_message(self, value: str, constraint: Constraint, lang: str = "de") -> str:
         if lang == "de":
             return f"Wert hat {len(value)} Zeichen, mindestens {constraint.value} erforderlich"
@@ -91,6 +155,11 @@ class EnumConstraint(ConstraintChecker):
             return True
         return value in constraint.values
 
+    def compile(self, constraint: Constraint) -> Callable[[str], bool]:
+        if not constraint.values:
+            return _always_valid
+        return frozenset(constraint.values).__contains__
+
     def get_message(self, value: str, constraint: Constraint, lang: str = "de") -> str:
         allowed = ", ".join(constraint.values or [])
         if lang == "de":
@@ -104,6 +173,9 @@ class RequiredConstraint(ConstraintChecker):
     def check(self, value: str, _constraint: Constraint, _context: dict[str, Any]) -> bool:
         return bool(value and value.strip())
 
+    def compile(self, _constraint: Constraint) -> Callable[[str], bool]:
+        return lambda value: bool(value and value.strip())
+
     def get_message(self, _value: str, constraint: Constraint, lang: str = "de") -> str:
         field = constraint.field or "Feld"
         if lang == "de":
@@ -122,20 +194,49 @@ class CharsetConstraint(ConstraintChecker):
         "uppercase": r"^[A-Z]*$",
     }
 
+    # ASCII members of the predefined charsets. A value consisting only of
+    # these characters matches without running the regex; anything else is
+    # left to the regex (e.g. non-ASCII digits for "digits").
+    ASCII_CHARS: ClassVar[dict[str, str]] = {
+        "digits": "0123456789",
+        "alphanumeric": "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789",
+        "belegfeld1": "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_$&%*+-/",
+        "uppercase": "ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+    }
+
     def check(self, value: str, constraint: Constraint, _context: dict[str, Any]) -> bool:
         # Use pattern if provided, otherwise look up charset name
         pattern = constraint.pattern
         if not pattern and constraint.params.get("charset"):
             charset_name = constraint.params["charset"]
+            allowed = self.ASCII_CHARS.get(charset_name)
+            # str.strip removes every allowed char from both ends in C;
+            # an empty remainder means the whole value is in the charset.
+            if allowed is not None and not value.strip(allowed):
+                return True
             pattern = self.CHARSETS.get(charset_name)
 
         if not pattern:
             return True
 
-        try:
-            return bool(re.match(pattern, value))
-        except re.error:
-            return False
+        return _regex_matches(pattern, value)
+
+    def compile(self, constraint: Constraint) -> Callable[[str], bool]:
+        if constraint.pattern:
+            return _compile_match(constraint.pattern)
+
+        charset_name = constraint.params.get("charset")
+        if not charset_name:
+            return _always_valid
+        pattern = self.CHARSETS.get(charset_name)
+        if not pattern:
+            return _always_valid
+
+        matches = _compile_match(pattern)
+        allowed = self.ASCII_CHARS.get(charset_name)
+        if allowed is None:
+            return matches
+        return lambda value: not value.strip(allowed) or matches(value)
 
     def get_message(self, _value: str, constraint: Constraint, lang: str = "de") -> str:
         charset = constraint.params.get("charset", "unbekannt")
@@ -201,6 +302,24 @@ class ConstraintRegistry:
             return True
         return checker.check(value, constraint, context or {})
 
+    @classmethod
+    def compile(cls, constraint: Constraint) -> Callable[[str], bool]:
+        """Compile a constraint into a ``value -> bool`` predicate for repeated checks."""
+        checker = cls.get(constraint.type)
+        if checker is None:
+            # Unknown constraint type - pass
+            return _always_valid
+        return checker.compile(constraint)
+
+    @classmethod
+    def compile_message(cls, constraint: Constraint, lang: str = "de") -> Callable[[str], str]:
+        """Compile the violation message for a constraint into a ``value -> str`` formatter."""
+        checker = cls.get(constraint.type)
+        if checker is None:
+            message = f"Constraint '{constraint.type}' violated"
+            return lambda _value: message
+        return checker.compile_message(constraint, lang)
+
     @classmethod
     def get_message(
         cls,
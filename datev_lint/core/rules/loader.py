@@ -10,14 +10,11 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 import yaml
+from pydantic import TypeAdapter, ValidationError
 
 from .models import (
-    Constraint,
-    FixStep,
-    FixStrategy,
     Profile,
     ProfileOverrides,
-    RiskLevel,
     Rule,
     Severity,
     Stage,
@@ -28,6 +25,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Validates a whole rule document in a single pydantic-core call
+_RULE_LIST_ADAPTER: TypeAdapter[list[Rule]] = TypeAdapter(list[Rule])
+
 
 def load_rules_from_yaml(path: Path) -> list[Rule]:
     """
@@ -58,73 +58,78 @@ def load_rules_from_yaml(path: Path) -> list[Rule]:
         data = yaml.safe_load(f) or {}
 
     rules_data = data.get("rules", {})
-    rules: list[Rule] = []
+    normalized: list[tuple[str, dict[str, Any]]] = []
 
     for rule_id, rule_data in rules_data.items():
         try:
-            rule = _parse_rule(rule_id, rule_data)
-            rules.append(rule)
+            normalized.append((rule_id, _normalize_rule_data(rule_id, rule_data)))
         except Exception:
             logger.warning("Failed to load rule %s from %s", rule_id, path, exc_info=True)
 
-    return rules
+    # Validate the whole document in one pass; only fall back to per-rule
+    # validation when something is invalid, so one bad rule does not drop the file.
+    try:
+        return _RULE_LIST_ADAPTER.validate_python([item for _, item in normalized])
+    except ValidationError:
+        pass
 
+    rules: list[Rule] = []
+    for rule_id, item in normalized:
+        try:
+            rules.append(Rule.model_validate(item))
+        except ValidationError:
+            logger.warning("Failed to load rule %s from %s", rule_id, path, exc_info=True)
+
+    return rules
 
-def _parse_rule(rule_id: str, data: dict[str, Any]) -> Rule:
-    """Parse a single rule from YAML data."""
-    # Parse stage
-    stage_str = data.get("stage", "row_semantic")
-    stage = Stage(stage_str) if isinstance(stage_str, str) else Stage.ROW_SEMANTIC
 
-    # Parse severity
-    severity_str = data.get("severity", "error")
-    severity = Severity(severity_str) if isinstance(severity_str, str) else Severity.ERROR
+def _normalize_rule_data(rule_id: str, data: dict[str, Any]) -> dict[str, Any]:
+    """Apply loader defaults to raw YAML rule data, ready for validation."""
+    stage = data.get("stage", "row_semantic")
+    severity = data.get("severity", "error")
 
-    # Parse constraint
     constraint_data = data.get("constraint", {})
-    constraint = Constraint(
-        type=constraint_data.get("type", "regex"),
-        pattern=constraint_data.get("pattern"),
-        value=constraint_data.get("value"),
-        values=constraint_data.get("values"),
-        field=constraint_data.get("field"),
-        params=constraint_data.get("params", {}),
-    )
+    constraint = {
+        "type": constraint_data.get("type", "regex"),
+        "pattern": constraint_data.get("pattern"),
+        "value": constraint_data.get("value"),
+        "values": constraint_data.get("values"),
+        "field": constraint_data.get("field"),
+        "params": constraint_data.get("params", {}),
+    }
 
-    # Parse fix strategy if present
     fix = None
     if "fix" in data:
         fix_data = data["fix"]
-        steps = []
-        for step_data in fix_data.get("steps", []):
-            steps.append(
-                FixStep(
-                    operation=step_data.get("operation", ""),
-                    params=step_data.get("params", {}),
-                )
-            )
-        fix = FixStrategy(
-            type=fix_data.get("type", ""),
-            steps=steps,
-            risk=RiskLevel(fix_data.get("risk", "medium")),
-            requires_approval=fix_data.get("requires_approval", False),
-        )
-
-    return Rule(
-        id=rule_id,
-        version=data.get("version", "1.0.0"),
-        title=data.get("title", rule_id),
-        stage=stage,
-        severity=severity,
-        applies_to=data.get("applies_to", "row"),
-        selector=data.get("selector", {}),
-        constraint=constraint,
-        message=data.get("message", {}),
-        docs_url=data.get("docs_url"),
-        fix=fix,
-        tags=data.get("tags", []),
-        deprecated=data.get("deprecated", False),
-    )
+        fix = {
+            "type": fix_data.get("type", ""),
+            "steps": [
+                {
+                    "operation": step_data.get("operation", ""),
+                    "params": step_data.get("params", {}),
+                }
+                for step_data in fix_data.get("steps", [])
+            ],
+            "risk": fix_data.get("risk", "medium"),
+            "requires_approval": fix_data.get("requires_approval", False),
+        }
+
+    return {
+        "id": rule_id,
+        "version": data.get("version", "1.0.0"),
+        "title": data.get("title", rule_id),
+        "stage": stage if isinstance(stage, str) else Stage.ROW_SEMANTIC,
+        "severity": severity if isinstance(severity, str) else Severity.ERROR,
+        "applies_to": data.get("applies_to", "row"),
+        "selector": data.get("selector", {}),
+        "constraint": constraint,
+        "message": data.get("message", {}),
+        "docs_url": data.get("docs_url"),
+        "fix": fix,
+        "columns_needed": data.get("columns_needed", []),
+        "tags": data.get("tags", []),
+        "deprecated": data.get("deprecated", False),
+    }
 
 
 def load_profile_from_yaml(path: Path) -> Profile | None:
@@ -123,6 +123,12 @@ class Rule(BaseModel, frozen=True):
     # Fix
     fix: FixStrategy | None = Field(default=None, description="Fix strategy if available")
 
+    # Cross-row
+    columns_needed: list[str] = Field(
+        default_factory=list,
+        description="Fields collected for cross_row rules, e.g., ['belegfeld1']",
+    )
+
     # Metadata
     tags: list[str] = Field(default_factory=list, description="Tags for filtering")
     deprecated: bool = Field(default=False)
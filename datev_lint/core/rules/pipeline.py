@@ -6,12 +6,16 @@ Orchestrates stage-based rule execution.
 
 from __future__ import annotations
 
+import re
 import time
-from collections import Counter
-from typing import TYPE_CHECKING, ClassVar
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import TYPE_CHECKING, ClassVar, NamedTuple
 
 import datev_lint
-from datev_lint.core.parser import BookingRow, ParserError
+from datev_lint.core.parser import ParserError
+from datev_lint.core.parser import Severity as ParserSeverity
 
 from .constraints import ConstraintRegistry
 from .models import (
@@ -27,9 +31,130 @@ from .models import (
 from .registry import RuleRegistry, get_registry
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Iterator
+
     from datev_lint.core.parser import ParseResult
 
 
+class _RowRulePlan(NamedTuple):
+    """Per-rule values resolved once per run for the row loop."""
+
+    rule: Rule
+    field_name: str
+    check: Callable[[str], bool]
+    is_required: bool
+    fix_steps: list[tuple[str, Callable[[str], str]]]
+    message: str
+    format_message: Callable[[str], str]
+
+
+class _FieldPlan(NamedTuple):
+    """Row rules sharing one field, so the raw value is fetched once per row."""
+
+    field_name: str
+    rules: list[_RowRulePlan]
+    required_rules: list[_RowRulePlan]
+
+
+class _RunPlan(NamedTuple):
+    """Rules and row checks compiled for one profile/registry state."""
+
+    rules_by_stage: dict[Stage, list[Rule]]
+    header_checks: dict[str, _RowRulePlan]
+    field_plans: list[_FieldPlan]
+    cross_row_fields: list[str]
+
+
+class _CrossRowColumns(NamedTuple):
+    """Field values collected in one row pass for cross-row rules (column-wise)."""
+
+    row_nos: list[int]
+    values: dict[str, list[str | None]]
+
+
+@dataclass(slots=True)
+class _RunState:
+    """State of a single pipeline run, filled while its findings are produced."""
+
+    stats: dict[str, int] = field(default_factory=lambda: {"rows_checked": 0, "rules_run": 0})
+    row_count: int = 0
+    aborted_at_stage: Stage | None = None
+
+
+# Engine version stamped on every finding
+_ENGINE_VERSION = datev_lint.__version__
+
+# Parser severities mapped to finding severities (same values)
+_PARSER_SEVERITY = {severity: Severity(severity.value) for severity in ParserSeverity}
+
+# Constraint types whose checks are costly enough to cache per distinct value
+_MEMOIZED_CONSTRAINT_TYPES = frozenset({"regex", "charset"})
+
+# Row violations buffered before findings are built and yielded
+_FINDINGS_BATCH_SIZE = 1024
+
+# Upper bound on cached values per compiled rule
+_CHECK_CACHE_SIZE = 4096
+
+
+def _memoize_check(check: Callable[[str], bool]) -> Callable[[str], bool]:
+    """
+    Evaluate a check once per distinct value.
+
+    DATEV columns are typically low-cardinality (accounts, S/H, BU keys), so
+    most rows repeat a value already seen. Once the cache is full, new values
+    are checked directly without being stored.
+    """
+    cache: dict[str, bool] = {}
+    cache_get = cache.get
+
+    def cached_check(value: str) -> bool:
+        result = cache_get(value)
+        if result is None:
+            result = check(value)
+            if len(cache) < _CHECK_CACHE_SIZE:
+                cache[value] = result
+        return result
+
+    return cached_check
+
+
+# Characters kept by the sanitize_chars fix when a rule gives no pattern
+_DEFAULT_SANITIZE_PATTERN = r"[^A-Z0-9_$&%*+\-/]"
+
+
+def _truncate_to(max_len: int) -> Callable[[str], str]:
+    return lambda value: value[:max_len]
+
+
+def _sanitize_with(pattern: re.Pattern[str]) -> Callable[[str], str]:
+    sub = pattern.sub
+    return lambda value: sub("", value.upper())
+
+
+def _compile_fix_steps(rule: Rule) -> list[tuple[str, Callable[[str], str]]]:
+    """Compile a rule's fix steps into (operation, value -> new value) pairs."""
+    steps: list[tuple[str, Callable[[str], str]]] = []
+    if not rule.fix:
+        return steps
+
+    for step in rule.fix.steps:
+        if step.operation == "upper":
+            steps.append((step.operation, str.upper))
+        elif step.operation == "truncate":
+            max_len = step.params.get("max_length", rule.constraint.value or 36)
+            steps.append((step.operation, _truncate_to(max_len)))
+        elif step.operation == "sanitize_chars":
+            # Remove invalid characters based on pattern
+            try:
+                pattern = re.compile(step.params.get("pattern", _DEFAULT_SANITIZE_PATTERN))
+            except re.error:
+                continue
+            steps.append((step.operation, _sanitize_with(pattern)))
+
+    return steps
+
+
 class PipelineResult:
     """Result of pipeline execution."""
 
@@ -47,23 +172,28 @@ class PipelineResult:
     ) -> None:
         self.findings = findings
         self.aborted_at_stage = aborted_at_stage
-        self.engine_version = engine_version or datev_lint.__version__
+        self.engine_version = engine_version or _ENGINE_VERSION
         self.profile_version = profile_version
         self.stats = stats or {}
         self.file = file
         self.encoding = encoding
         self.row_count = row_count
         self.profile_id = profile_id
+        self._severity_counts: Counter[Severity] | None = None
+        self._code_counts: Counter[str] | None = None
+        self._by_code: dict[str, list[Finding]] | None = None
 
     @property
     def has_fatal(self) -> bool:
         """Check if any fatal findings."""
-        return any(f.severity == Severity.FATAL for f in self.findings)
+        severity_counts, _ = self._tally()
+        return severity_counts[Severity.FATAL] > 0
 
     @property
     def has_errors(self) -> bool:
         """Check if any error or fatal findings."""
-        return any(f.severity in (Severity.FATAL, Severity.ERROR) for f in self.findings)
+        severity_counts, _ = self._tally()
+        return severity_counts[Severity.FATAL] + severity_counts[Severity.ERROR] > 0
 
     def get_summary(
         self,
@@ -72,8 +202,7 @@ class PipelineResult:
         row_count: int | None = None,
     ) -> ValidationSummary:
         """Create a validation summary."""
-        severity_counts = Counter(f.severity for f in self.findings)
-        code_counts = Counter(f.code for f in self.findings)
+        severity_counts, code_counts = self._tally()
 
         file_value = file or self.file or "<unknown>"
         encoding_value = encoding or self.encoding or "<unknown>"
@@ -95,6 +224,37 @@ class PipelineResult:
             duration_ms=self.stats.get("duration_ms", 0),
         )
 
+    def findings_for(self, *codes: str) -> list[Finding]:
+        """
+        Get the findings with any of the given codes.
+
+        Findings are indexed by code once per result and returned grouped by
+        code, in the order the codes are given.
+        """
+        if self._by_code is None:
+            by_code: dict[str, list[Finding]] = {}
+            for finding in self.findings:
+                by_code.setdefault(finding.code, []).append(finding)
+            self._by_code = by_code
+        by_code_get = self._by_code.get
+        return [finding for code in codes for finding in by_code_get(code, ())]
+
+    def _tally(self) -> tuple[Counter[Severity], Counter[str]]:
+        """Count findings by severity and by code, once per result."""
+        if self._severity_counts is None or self._code_counts is None:
+            # One C-level pass counts (severity, code) pairs; the few distinct
+            # pairs are then folded into both tallies. Codes keep their
+            # first-seen order, so most_common() breaks ties as before.
+            severity_counts: Counter[Severity] = Counter()
+            code_counts: Counter[str] = Counter()
+            pairs = Counter(map(attrgetter("severity", "code"), self.findings))
+            for (severity, code), count in pairs.items():
+                severity_counts[severity] += count
+                code_counts[code] += count
+            self._severity_counts = severity_counts
+            self._code_counts = code_counts
+        return self._severity_counts, self._code_counts
+
 
 class ExecutionPipeline:
     """
@@ -106,6 +266,9 @@ class ExecutionPipeline:
     # Stages where FATAL findings abort execution
     FATAL_STAGES: ClassVar[set[Stage]] = {Stage.PARSE, Stage.HEADER}
 
+    # Stages evaluated together in one pass over the rows
+    ROW_STAGES: ClassVar[set[Stage]] = {Stage.SCHEMA, Stage.ROW_SEMANTIC}
+
     def __init__(
         self,
         registry: RuleRegistry | None = None,
@@ -114,167 +277,388 @@ class ExecutionPipeline:
         self.registry = registry or get_registry()
         self.profile = profile
         self._rules_by_stage: dict[Stage, list[Rule]] = {}
+        self._header_checks: dict[str, _RowRulePlan] = {}
+        self._plan: _RunPlan | None = None
+        self._plan_profile: Profile | None = None
+        self._plan_token = -1
+        self._columns: _CrossRowColumns | None = None
+
+        # State of the last finished run (published when its findings are exhausted)
+        self.stats: dict[str, int] = {}
+        self.row_count = 0
+        self.aborted_at_stage: Stage | None = None
 
     def run(self, parse_result: ParseResult) -> PipelineResult:
         """Run all stages, collecting findings."""
-        start_time = time.perf_counter()
-
-        findings: list[Finding] = []
-        stats: dict[str, int] = {
-            "rows_checked": 0,
-            "rules_run": 0,
-        }
+        state = _RunState()
+        findings = list(self._iter_run(parse_result, state))
+        return self._finalize(findings, parse_result, state)
+
+    def run_iter(self, parse_result: ParseResult) -> Iterator[Finding]:
+        """
+        Run all stages, yielding findings as they are produced.
+
+        Lets callers stream findings (e.g., to a report) without holding them
+        all in memory. Once the iterator is exhausted, ``stats``, ``row_count``
+        and ``aborted_at_stage`` describe the run.
+
+        Each run keeps its counters in its own state, but cross-row columns
+        are held on the pipeline: do not interleave two run_iter() iterators
+        of the same pipeline, or share one pipeline across threads.
+        """
+        return self._iter_run(parse_result, _RunState())
+
+    def _iter_run(self, parse_result: ParseResult, state: _RunState) -> Iterator[Finding]:
+        """Yield the findings of one run, timing it and publishing its state when done."""
+        start_ns = time.monotonic_ns()
+        try:
+            yield from self._iter_stages(parse_result, state)
+        finally:
+            state.stats["duration_ms"] = (time.monotonic_ns() - start_ns) // 1_000_000
+            self.stats = state.stats
+            self.row_count = state.row_count
+            self.aborted_at_stage = state.aborted_at_stage
+
+    def _iter_stages(self, parse_result: ParseResult, state: _RunState) -> Iterator[Finding]:
+        """Yield findings of all stages in order, stopping at a fatal abort."""
+        stats = state.stats
         filename = str(parse_result.file_path)
 
-        # Get profile-filtered rules
-        if self.profile:
-            rules = self.registry.get_rules_for_profile(self.profile)
-        else:
-            rules = list(self.registry.rules.values())
+        plan = self._get_plan()
+        self._rules_by_stage = plan.rules_by_stage
+        self._header_checks = plan.header_checks
+        self._columns = None
+        cross_row_fields = plan.cross_row_fields
 
-        # Group rules by stage
-        self._rules_by_stage = {}
-        for rule in rules:
-            if rule.stage not in self._rules_by_stage:
-                self._rules_by_stage[rule.stage] = []
-            self._rules_by_stage[rule.stage].append(rule)
-
-        # Include parser errors (header/columns) as findings.
-        parser_findings = [
-            self._parser_error_to_finding(error, filename) for error in parse_result.header_errors
-        ]
-        findings.extend(parser_findings)
+        # Include parser errors (header/columns) as findings, noting fatals as we go.
+        parse_fatal = False
+        for error in parse_result.header_errors:
+            finding = self._parser_error_to_finding(error, filename)
+            if finding.severity is Severity.FATAL:
+                parse_fatal = True
+            yield finding
 
         # Abort early if parsing already failed fatally.
-        if any(f.severity == Severity.FATAL for f in parser_findings):
-            end_time = time.perf_counter()
-            stats["duration_ms"] = int((end_time - start_time) * 1000)
-            return PipelineResult(
-                findings=findings,
-                aborted_at_stage=Stage.PARSE,
-                profile_version=self.profile.version if self.profile else "1.0.0",
-                stats=stats,
-                file=filename,
-                encoding=parse_result.encoding,
-                row_count=0,
-                profile_id=self.profile.id if self.profile else "default",
-            )
+        if parse_fatal:
+            state.aborted_at_stage = Stage.PARSE
+            return
 
-        # Run stages in order
-        row_count = 0
-        for stage in Stage:
+        # Run populated stages in order
+        row_stages_done = False
+        for stage, stage_rules in self._rules_by_stage.items():
             # Run SCHEMA + ROW_SEMANTIC in a single pass for performance.
-            if stage == Stage.SCHEMA:
+            if stage in self.ROW_STAGES:
+                if row_stages_done:
+                    continue
+                row_stages_done = True
+
                 schema_rules = self._rules_by_stage.get(Stage.SCHEMA, [])
                 semantic_rules = self._rules_by_stage.get(Stage.ROW_SEMANTIC, [])
 
-                stage_findings, row_count = self._run_row_stages(
+                state.row_count, self._columns = yield from self._iter_row_stages(
                     parse_result=parse_result,
-                    schema_rules=schema_rules,
-                    semantic_rules=semantic_rules,
+                    field_plans=plan.field_plans,
                     filename=filename,
+                    collect_fields=cross_row_fields,
                 )
-                findings.extend(stage_findings)
-                stats["rows_checked"] = row_count
+                stats["rows_checked"] = state.row_count
                 stats["rules_run"] += len(schema_rules) + len(semantic_rules)
                 continue
 
-            if stage == Stage.ROW_SEMANTIC:
-                continue
+            if stage is Stage.CROSS_ROW and cross_row_fields and self._columns is None:
+                # No row pass ran; collect the needed columns on their own.
+                self._columns = self._collect_columns(parse_result, cross_row_fields)
 
-            stage_findings = self._run_stage(stage, parse_result, filename)
-            findings.extend(stage_findings)
-            stats["rules_run"] += len(self._rules_by_stage.get(stage, []))
+            stage_findings, stage_fatal = self._run_stage(stage, parse_result, filename)
+            yield from stage_findings
+            stats["rules_run"] += len(stage_rules)
 
             # Check for fatal abort
-            if stage in self.FATAL_STAGES and any(
-                f.severity == Severity.FATAL for f in stage_findings
-            ):
-                end_time = time.perf_counter()
-                stats["duration_ms"] = int((end_time - start_time) * 1000)
-                return PipelineResult(
-                    findings=findings,
-                    aborted_at_stage=stage,
-                    profile_version=self.profile.version if self.profile else "1.0.0",
-                    stats=stats,
-                    file=filename,
-                    encoding=parse_result.encoding,
-                    row_count=row_count,
-                    profile_id=self.profile.id if self.profile else "default",
-                )
+            if stage_fatal and stage in self.FATAL_STAGES:
+                state.aborted_at_stage = stage
+                return
+
+    def _get_plan(self) -> _RunPlan:
+        """Return the compiled plan, recompiling only if the profile or registry changed."""
+        token = self.registry.load_token
+        if (
+            self._plan is None
+            or self._plan_profile is not self.profile
+            or self._plan_token != token
+        ):
+            self._plan = self._compile_plan()
+            self._plan_profile = self.profile
+            self._plan_token = token
+        return self._plan
+
+    def _compile_plan(self) -> _RunPlan:
+        """Select, group and compile the rules of the bound profile."""
+        # Get profile-filtered rules
+        if self.profile:
+            rules = self.registry.get_rules_for_profile(self.profile)
+        else:
+            rules = list(self.registry.rules.values())
 
-        end_time = time.perf_counter()
-        stats["duration_ms"] = int((end_time - start_time) * 1000)
+        # Group rules by stage
+        grouped: defaultdict[Stage, list[Rule]] = defaultdict(list)
+        for rule in rules:
+            grouped[rule.stage].append(rule)
+
+        # Keep only populated stages, in execution order
+        rules_by_stage = {stage: grouped[stage] for stage in Stage if stage in grouped}
 
+        header_checks = {
+            entry.rule.id: entry
+            for entry in self._compile_row_plan(grouped[Stage.HEADER], memoize=False)
+        }
+        row_rules = [
+            rule for stage in (Stage.SCHEMA, Stage.ROW_SEMANTIC) for rule in grouped[stage]
+        ]
+        field_plans = self._group_by_field(self._compile_row_plan(row_rules))
+
+        return _RunPlan(
+            rules_by_stage=rules_by_stage,
+            header_checks=header_checks,
+            field_plans=field_plans,
+            cross_row_fields=self._cross_row_fields(rules_by_stage),
+        )
+
+    def _finalize(
+        self, findings: list[Finding], parse_result: ParseResult, state: _RunState
+    ) -> PipelineResult:
+        """Wrap the findings and the state of their run into a PipelineResult."""
         return PipelineResult(
             findings=findings,
+            aborted_at_stage=state.aborted_at_stage,
             profile_version=self.profile.version if self.profile else "1.0.0",
-            stats=stats,
-            file=filename,
+            stats=state.stats,
+            file=str(parse_result.file_path),
             encoding=parse_result.encoding,
-            row_count=row_count,
+            row_count=state.row_count,
             profile_id=self.profile.id if self.profile else "default",
         )
 
-    def _run_row_stages(
+    def _iter_row_stages(
         self,
         *,
         parse_result: ParseResult,
-        schema_rules: list[Rule],
-        semantic_rules: list[Rule],
+        field_plans: list[_FieldPlan],
         filename: str,
-    ) -> tuple[list[Finding], int]:
-        """Run schema + semantic row rules in a single pass over the file."""
-        findings: list[Finding] = []
+        collect_fields: list[str] | None = None,
+    ) -> Generator[Finding, None, tuple[int, _CrossRowColumns | None]]:
+        """
+        Run schema + semantic row rules in a single pass over the file.
+
+        Yields findings in file order and returns ``(rows_checked, columns)``.
+        Values of ``collect_fields`` are gathered column-wise in the same pass
+        for cross-row rules, so the file is not re-tokenized for them.
+
+        Rows are checked serially on purpose: rows are produced lazily by the
+        tokenizer, and the checks are pure-Python predicates that hold the GIL
+        (the re module does not release it), so a thread pool only adds
+        scheduling overhead.
+        """
         rows_checked = 0
 
-        if not schema_rules and not semantic_rules:
-            return findings, rows_checked
+        columns: _CrossRowColumns | None = None
+        collectors: list[tuple[str, Callable[[str | None], None]]] = []
+        record_row_no: Callable[[int], None] | None = None
+        if collect_fields:
+            columns = _CrossRowColumns(row_nos=[], values={name: [] for name in collect_fields})
+            record_row_no = columns.row_nos.append
+            collectors = [(name, values.append) for name, values in columns.values.items()]
+
+        # The hot loop only records violations as plain tuples (row errors are
+        # kept in place to preserve file order); findings are built in batches.
+        violations: list[tuple[_RowRulePlan, str, int] | ParserError] = []
+        record = violations.append
 
         for item in parse_result.rows:
-            if isinstance(item, ParserError):
-                findings.append(self._parser_error_to_finding(item, filename))
+            # Exact type check: pydantic models have an ABCMeta metaclass, so
+            # isinstance() goes through __instancecheck__ for every BookingRow.
+            if type(item) is ParserError:
+                record(item)
                 continue
 
             rows_checked += 1
-            for rule in schema_rules:
-                findings.extend(self._run_row_rule(rule, item, filename))
-            for rule in semantic_rules:
-                findings.extend(self._run_row_rule(rule, item, filename))
+            row_no = item.row_no
+            get_raw = item.get_raw
+            if record_row_no is not None:
+                record_row_no(row_no)
+                for name, collect in collectors:
+                    collect(get_raw(name))
+            for field_name, rules, required_rules in field_plans:
+                value = get_raw(field_name)
+                if value is None:
+                    for entry in required_rules:
+                        record((entry, "", row_no))
+                    continue
+                for entry in rules:
+                    if not entry.check(value):
+                        record((entry, value, row_no))
+
+            if len(violations) >= _FINDINGS_BATCH_SIZE:
+                yield from self._build_row_findings(violations, filename)
+                violations.clear()
+
+        yield from self._build_row_findings(violations, filename)
+        return rows_checked, columns
+
+    def _cross_row_fields(self, rules_by_stage: dict[Stage, list[Rule]]) -> list[str]:
+        """Union of fields declared by cross-row rules, in first-seen order."""
+        fields: dict[str, None] = {}
+        for rule in rules_by_stage.get(Stage.CROSS_ROW, []):
+            fields.update(dict.fromkeys(rule.columns_needed))
+        return list(fields)
+
+    def _collect_columns(self, parse_result: ParseResult, fields: list[str]) -> _CrossRowColumns:
+        """Collect field values column-wise in a single pass over the booking rows."""
+        columns = _CrossRowColumns(row_nos=[], values={name: [] for name in fields})
+        record_row_no = columns.row_nos.append
+        collectors = [(name, values.append) for name, values in columns.values.items()]
+
+        for row in parse_result.booking_rows:
+            record_row_no(row.row_no)
+            get_raw = row.get_raw
+            for name, collect in collectors:
+                collect(get_raw(name))
+
+        return columns
+
+    def _build_row_findings(
+        self,
+        violations: list[tuple[_RowRulePlan, str, int] | ParserError],
+        filename: str,
+    ) -> list[Finding]:
+        """Turn recorded row violations (and row parser errors) into findings."""
+        findings: list[Finding] = []
+        append = findings.append
+        engine_version = _ENGINE_VERSION
+        generate_fix_candidates = self._generate_fix_candidates
+
+        # Violations arrive grouped by row and field, and Location is frozen,
+        # so consecutive findings on the same cell share one Location.
+        location: Location | None = None
+        location_key: tuple[int, str] | None = None
+
+        for item in violations:
+            if isinstance(item, ParserError):
+                append(self._parser_error_to_finding(item, filename))
+                continue
+
+            entry, value, row_no = item
+            rule = entry.rule
+            field_name = entry.field_name
+            if location is None or location_key != (row_no, field_name):
+                location = Location(file=filename, row_no=row_no, field=field_name)
+                location_key = (row_no, field_name)
+
+            fix_candidates: list[FixCandidate] = []
+            if entry.fix_steps and value:
+                fix_candidates = generate_fix_candidates(rule, entry.fix_steps, value, field_name)
+
+            append(
+                Finding(
+                    code=rule.id,
+                    rule_version=rule.version,
+                    engine_version=engine_version,
+                    severity=rule.severity,
+                    title=rule.title,
+                    message=entry.message or entry.format_message(value),
+                    location=location,
+                    context={"raw_value": value},
+                    fix_candidates=fix_candidates,
+                    docs_url=rule.docs_url,
+                )
+            )
 
-        return findings, rows_checked
+        return findings
+
+    def _compile_row_plan(self, rules: list[Rule], *, memoize: bool = True) -> list[_RowRulePlan]:
+        """
+        Resolve selector and compiled check of rules once, dropping rules without a field.
+
+        Checks of costly constraint types are memoized per value unless
+        ``memoize`` is False (e.g., header rules, checked once per file).
+        """
+        plan: list[_RowRulePlan] = []
+        for rule in rules:
+            field_name = rule.selector.get("field")
+            if not field_name:
+                continue
+            check = ConstraintRegistry.compile(rule.constraint)
+            if memoize and rule.constraint.type in _MEMOIZED_CONSTRAINT_TYPES:
+                check = _memoize_check(check)
+            plan.append(
+                _RowRulePlan(
+                    rule=rule,
+                    field_name=field_name,
+                    check=check,
+                    is_required=rule.constraint.type == "required",
+                    fix_steps=_compile_fix_steps(rule),
+                    message=rule.get_message("de"),
+                    format_message=ConstraintRegistry.compile_message(rule.constraint, "de"),
+                )
+            )
+        return plan
+
+    def _group_by_field(self, plan: list[_RowRulePlan]) -> list[_FieldPlan]:
+        """Group planned rules by field, keeping first-seen field order."""
+        by_field: dict[str, list[_RowRulePlan]] = {}
+        for entry in plan:
+            by_field.setdefault(entry.field_name, []).append(entry)
+
+        return [
+            _FieldPlan(
+                field_name=field_name,
+                rules=entries,
+                required_rules=[entry for entry in entries if entry.is_required],
+            )
+            for field_name, entries in by_field.items()
+        ]
 
     def _run_stage(
         self,
         stage: Stage,
         parse_result: ParseResult,
         filename: str,
-    ) -> list[Finding]:
-        """Run all rules for a stage."""
-        rules = self._rules_by_stage.get(stage, [])
-        if not rules:
-            return []
+    ) -> tuple[list[Finding], bool]:
+        """
+        Run all rules for a stage.
 
+        Returns:
+            Tuple of (findings, whether any finding is FATAL)
+        """
+        rules = self._rules_by_stage.get(stage, [])
         findings: list[Finding] = []
+        fatal_seen = False
 
-        if stage == Stage.HEADER:
-            for rule in rules:
-                findings.extend(self._run_header_rule(rule, parse_result, filename))
-
-        elif stage == Stage.CROSS_ROW:
+        run_rule: Callable[[Rule, ParseResult, str, list[Finding]], None]
+        if stage is Stage.HEADER:
+            run_rule = self._run_header_rule
+        elif stage is Stage.CROSS_ROW:
             # Cross-row rules need to collect data first.
-            for rule in rules:
-                findings.extend(self._run_cross_row_rule(rule, parse_result, filename))
+            run_rule = self._run_cross_row_rule
+        else:
+            return findings, fatal_seen
 
-        return findings
+        # Rules append to the stage's findings list directly
+        for rule in rules:
+            emitted = len(findings)
+            run_rule(rule, parse_result, filename, findings)
+            # Rule findings carry the rule's severity
+            if rule.severity is Severity.FATAL and len(findings) > emitted:
+                fatal_seen = True
+
+        return findings, fatal_seen
 
     def _parser_error_to_finding(self, error: ParserError, filename: str) -> Finding:
         """Convert a ParserError to a Finding."""
         return Finding(
             code=error.code,
             rule_version="1.0.0",
-            engine_version=datev_lint.__version__,
-            severity=Severity(error.severity.value),
+            engine_version=_ENGINE_VERSION,
+            severity=_PARSER_SEVERITY[error.severity],
             title=error.title,
             message=error.message,
             location=Location(
@@ -291,153 +675,71 @@ class ExecutionPipeline:
         rule: Rule,
         parse_result: ParseResult,
         filename: str,
-    ) -> list[Finding]:
-        """Run a single header rule."""
-        findings: list[Finding] = []
+        findings: list[Finding],
+    ) -> None:
+        """Run a single header rule, appending its finding to ``findings``."""
         header = parse_result.header
 
-        # Get the field to validate
-        field_name = rule.selector.get("field")
-        if not field_name:
-            return findings
+        # Compiled check; rules without a field selector are not planned
+        entry = self._header_checks.get(rule.id)
+        if entry is None:
+            return
+        field_name = entry.field_name
 
         # Get field value from header
         value = getattr(header, field_name, None)
         value = "" if value is None else str(value)
 
-        # Check constraint
-        is_valid = ConstraintRegistry.check(value, rule.constraint)
-
-        if not is_valid:
-            message = ConstraintRegistry.get_message(value, rule.constraint, "de")
+        if not entry.check(value):
             findings.append(
                 Finding(
                     code=rule.id,
                     rule_version=rule.version,
-                    engine_version=datev_lint.__version__,
+                    engine_version=_ENGINE_VERSION,
                     severity=rule.severity,
                     title=rule.title,
-                    message=rule.get_message("de") or message,
+                    message=entry.message or entry.format_message(value),
                     location=Location(file=filename, row_no=1, field=field_name),
                     context={"raw_value": value},
                 )
             )
 
-        return findings
-
-    def _run_row_rule(
-        self,
-        rule: Rule,
-        row: BookingRow,
-        filename: str,
-    ) -> list[Finding]:
-        """Run a single row rule."""
-        findings: list[Finding] = []
-
-        # Get the field to validate
-        field_name = rule.selector.get("field")
-        if not field_name:
-            return findings
-
-        # Get field value
-        value = row.get_raw(field_name)
-        if value is None:
-            # Check if required
-            if rule.constraint.type == "required":
-                findings.append(self._create_finding(rule, "", row.row_no, field_name, filename))
-            return findings
-
-        # Check constraint
-        is_valid = ConstraintRegistry.check(value, rule.constraint)
-
-        if not is_valid:
-            finding = self._create_finding(rule, value, row.row_no, field_name, filename)
-
-            # Add fix candidates if available
-            if rule.fix:
-                fix_candidates = self._generate_fix_candidates(rule, value, field_name)
-                finding = Finding(
-                    code=finding.code,
-                    rule_version=finding.rule_version,
-                    engine_version=finding.engine_version,
-                    severity=finding.severity,
-                    title=finding.title,
-                    message=finding.message,
-                    location=finding.location,
-                    context=finding.context,
-                    fix_candidates=fix_candidates,
-                    docs_url=finding.docs_url,
-                )
-
-            findings.append(finding)
-
-        return findings
-
     def _run_cross_row_rule(
         self,
         _rule: Rule,
         _parse_result: ParseResult,
         _filename: str,
-    ) -> list[Finding]:
-        """Run a cross-row rule (e.g., duplicate detection)."""
+        _findings: list[Finding],
+    ) -> None:
+        """
+        Run a cross-row rule (e.g., duplicate detection), appending to ``findings``.
+
+        Values of the rule's ``columns_needed`` fields are available in
+        ``self._columns``, collected once for all cross-row rules.
+        """
         # Cross-row rules are typically implemented as Python plugins
         # This is a placeholder for the cross-row execution
-        return []
-
-    def _create_finding(
-        self,
-        rule: Rule,
-        value: str,
-        row_no: int,
-        field_name: str,
-        filename: str,
-    ) -> Finding:
-        """Create a finding from a rule violation."""
-        message = ConstraintRegistry.get_message(value, rule.constraint, "de")
-
-        return Finding(
-            code=rule.id,
-            rule_version=rule.version,
-            engine_version=datev_lint.__version__,
-            severity=rule.severity,
-            title=rule.title,
-            message=rule.get_message("de") or message,
-            location=Location(file=filename, row_no=row_no, field=field_name),
-            context={"raw_value": value},
-            docs_url=rule.docs_url,
-        )
 
     def _generate_fix_candidates(
         self,
         rule: Rule,
+        fix_steps: list[tuple[str, Callable[[str], str]]],
         value: str,
         field_name: str,
     ) -> list[FixCandidate]:
-        """Generate fix candidates for a rule violation."""
+        """Generate fix candidates for a rule violation from its compiled fix steps."""
         candidates: list[FixCandidate] = []
 
         if not rule.fix:
             return candidates
 
-        for step in rule.fix.steps:
-            new_value = value
-
-            if step.operation == "upper":
-                new_value = value.upper()
-            elif step.operation == "truncate":
-                max_len = step.params.get("max_length", rule.constraint.value or 36)
-                new_value = value[:max_len]
-            elif step.operation == "sanitize_chars":
-                # Remove invalid characters based on pattern
-                import re
-
-                pattern = step.params.get("pattern", r"[^A-Z0-9_$&%*+\-/]")
-                new_value = re.sub(pattern, "", value.upper())
+        for operation, apply in fix_steps:
+            new_value = apply(value)
 
             if new_value != value:
                 candidates.append(
                     FixCandidate(
-                        operation=step.operation,
+                        operation=operation,
                         field=field_name,
                         old_value=value,
                         new_value=new_value,
@@ -7,10 +7,43 @@ Central registry for all rules and profiles.
 from __future__ import annotations
 
 import fnmatch
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 from .loader import load_profiles_from_directory, load_rules_from_directory
-from .models import Profile, Rule, Severity
+from .models import Profile, ProfileOverrides, Rule, Severity
+
+
+def _compile_globs(patterns: list[str]) -> re.Pattern[str] | None:
+    """
+    Compile glob patterns into one regex matching any of them.
+
+    Matches like ``fnmatch.fnmatch`` (names and patterns are normcase'd);
+    returns None if there are no patterns.
+    """
+    if not patterns:
+        return None
+    return re.compile(
+        "|".join(fnmatch.translate(os.path.normcase(pattern)) for pattern in patterns)
+    )
+
+
+@lru_cache(maxsize=1)
+def _load_builtin_definitions() -> tuple[tuple[Rule, ...], tuple[Profile, ...]]:
+    """
+    Load the built-in rules and profiles from the package, once per process.
+
+    Rules and profiles are frozen, so every registry can share them.
+    """
+    rules_dir = Path(__file__).parent.parent.parent / "rules"
+    profiles_dir = rules_dir / "profiles"
+
+    rules = load_rules_from_directory(rules_dir) if rules_dir.exists() else []
+    profiles = load_profiles_from_directory(profiles_dir) if profiles_dir.exists() else []
+    return tuple(rules), tuple(profiles)
 
 
 class RuleRegistry:
@@ -27,14 +60,29 @@ class RuleRegistry:
         self.rules: dict[str, Rule] = {}
         self.profiles: dict[str, Profile] = {}
         self._loaded = False
+        # Bumped on every registration so callers can tell when cached
+        # rule selections are stale.
+        self._load_token = 0
+        # Rule selections per (profile id, version): (load token, profile, rules)
+        self._profile_cache: dict[tuple[str, str], tuple[int, Profile, list[Rule]]] = {}
+        # Resolved inheritance per profile id: (profile, resolved profile)
+        self._resolved_profiles: dict[str, tuple[Profile, Profile]] = {}
+
+    @property
+    def load_token(self) -> int:
+        """Counter that changes whenever a rule or profile is registered."""
+        return self._load_token
 
     def register_rule(self, rule: Rule) -> None:
         """Register a rule."""
         self.rules[rule.id] = rule
+        self._load_token += 1
 
     def register_profile(self, profile: Profile) -> None:
         """Register a profile."""
         self.profiles[profile.id] = profile
+        self._resolved_profiles.clear()
+        self._load_token += 1
 
     def get_rule(self, rule_id: str) -> Rule | None:
         """Get a rule by ID."""
@@ -52,29 +100,51 @@ class RuleRegistry:
         - Glob patterns in enable/disable
         - Severity overrides
         - Profile inheritance via base
+
+        Results are cached until a rule or profile is registered.
         """
+        key = (profile.id, profile.version)
+        cached = self._profile_cache.get(key)
+        if cached is not None:
+            token, cached_profile, cached_rules = cached
+            if token == self._load_token and (
+                cached_profile is profile or cached_profile == profile
+            ):
+                return list(cached_rules)
+
+        enabled_rules = self._select_rules(profile)
+        self._profile_cache[key] = (self._load_token, profile, enabled_rules)
+        return list(enabled_rules)
+
+    def _select_rules(self, profile: Profile) -> list[Rule]:
+        """Filter and override registered rules for a profile (uncached)."""
         # Resolve inheritance
         resolved_profile = self._resolve_profile(profile)
 
+        # Compile enable/disable globs once instead of per rule and pattern
+        enable_re = _compile_globs(resolved_profile.enable)
+        disable_re = _compile_globs(resolved_profile.disable)
+        disabled_ids = set(resolved_profile.overrides.disabled)
+
         # Filter rules by enable/disable patterns
         enabled_rules: list[Rule] = []
+        if enable_re is None:
+            return enabled_rules
 
         for rule in self.rules.values():
             if rule.deprecated:
                 continue
 
+            rule_id = os.path.normcase(rule.id)
+
             # Check if rule matches any enable pattern
-            matches_enable = any(
-                fnmatch.fnmatch(rule.id, pattern) for pattern in resolved_profile.enable
-            )
+            matches_enable = enable_re.match(rule_id) is not None
 
             # Check if rule matches any disable pattern
-            matches_disable = any(
-                fnmatch.fnmatch(rule.id, pattern) for pattern in resolved_profile.disable
-            )
+            matches_disable = disable_re is not None and disable_re.match(rule_id) is not None
 
             # Check if explicitly disabled in overrides
-            explicitly_disabled = rule.id in resolved_profile.overrides.disabled
+            explicitly_disabled = rule.id in disabled_ids
 
             if matches_enable and not matches_disable and not explicitly_disabled:
                 # Apply severity override if present
@@ -82,22 +152,8 @@ class RuleRegistry:
                     severity_str = resolved_profile.overrides.severity[rule.id]
                     try:
                         new_severity = Severity(severity_str)
-                        # Create new rule with overridden severity
-                        rule = Rule(
-                            id=rule.id,
-                            version=rule.version,
-                            title=rule.title,
-                            stage=rule.stage,
-                            severity=new_severity,
-                            applies_to=rule.applies_to,
-                            selector=rule.selector,
-                            constraint=rule.constraint,
-                            message=rule.message,
-                            docs_url=rule.docs_url,
-                            fix=rule.fix,
-                            tags=rule.tags,
-                            deprecated=rule.deprecated,
-                        )
+                        # Copy the rule with overridden severity (keeps every field)
+                        rule = rule.model_copy(update={"severity": new_severity})
                     except ValueError:
                         pass
 
@@ -110,64 +166,64 @@ class RuleRegistry:
         if not profile.base:
             return profile
 
-        base = self.get_profile(profile.base)
-        if not base:
+        cached = self._resolved_profiles.get(profile.id)
+        if cached is not None and cached[0] is profile:
+            return cached[1]
+
+        # Walk up the inheritance chain (stopping at unknown or repeated bases)
+        chain = [profile]
+        seen = {profile.id}
+        base_id: str | None = profile.base
+        while base_id and base_id not in seen:
+            base = self.get_profile(base_id)
+            if not base:
+                break
+            chain.append(base)
+            seen.add(base_id)
+            base_id = base.base
+
+        if len(chain) == 1:
             return profile
 
-        # Recursively resolve base
-        resolved_base = self._resolve_profile(base)
-
-        # Merge: profile overrides base
-        merged_enable = resolved_base.enable + [
-            p for p in profile.enable if p not in resolved_base.enable
-        ]
-        merged_disable = resolved_base.disable + [
-            p for p in profile.disable if p not in resolved_base.disable
-        ]
-
-        merged_severity = {**resolved_base.overrides.severity, **profile.overrides.severity}
-        merged_params = {**resolved_base.overrides.params, **profile.overrides.params}
-        merged_disabled = list(
-            set(resolved_base.overrides.disabled) | set(profile.overrides.disabled)
-        )
-
-        from .models import ProfileOverrides
-
-        return Profile(
+        # Merge from the root down: each profile overrides its bases
+        enable: dict[str, None] = {}
+        disable: dict[str, None] = {}
+        severity: dict[str, str] = {}
+        params: dict[str, dict[str, Any]] = {}
+        disabled: dict[str, None] = {}
+        for current in reversed(chain):
+            enable.update(dict.fromkeys(current.enable))
+            disable.update(dict.fromkeys(current.disable))
+            severity.update(current.overrides.severity)
+            params.update(current.overrides.params)
+            disabled.update(dict.fromkeys(current.overrides.disabled))
+
+        resolved = Profile(
             id=profile.id,
             version=profile.version,
             label=profile.label,
             base=None,  # Already resolved
-            enable=merged_enable,
-            disable=merged_disable,
+            enable=list(enable),
+            disable=list(disable),
             overrides=ProfileOverrides(
-                severity=merged_severity,
-                params=merged_params,
-                disabled=merged_disabled,
+                severity=severity,
+                params=params,
+                disabled=list(disabled),
             ),
         )
+        self._resolved_profiles[profile.id] = (profile, resolved)
+        return resolved
 
     def load_builtin(self) -> None:
         """Load built-in rules from package."""
         if self._loaded:
             return
 
-        # Find the package rules directory
-        package_dir = Path(__file__).parent.parent.parent
-        rules_dir = package_dir / "rules"
-        profiles_dir = rules_dir / "profiles"
-
-        # Load rules
-        if rules_dir.exists():
-            rules = load_rules_from_directory(rules_dir)
-            for rule in rules:
-                self.register_rule(rule)
-
-        # Load profiles
-        if profiles_dir.exists():
-            profiles = load_profiles_from_directory(profiles_dir)
-            for profile in profiles:
-                self.register_profile(profile)
+        rules, profiles = _load_builtin_definitions()
+        for rule in rules:
+            self.register_rule(rule)
+        for profile in profiles:
+            self.register_profile(profile)
 
         self._loaded = True
 
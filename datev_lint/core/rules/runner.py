@@ -0,0 +1,84 @@
+"""
+Batch Runner.
+
+Validates many files in parallel, one file per worker process.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from datev_lint.core.parser import parse_file
+
+from .pipeline import ExecutionPipeline, PipelineResult
+from .registry import get_registry
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# Pipeline reused by all files handled in a pool worker (compiled plan is cached)
+_worker_pipeline: ExecutionPipeline | None = None
+
+
+def _build_pipeline(profile_id: str | None) -> ExecutionPipeline:
+    """Create a pipeline bound to the given profile (None for all rules)."""
+    registry = get_registry()
+    profile = registry.get_profile(profile_id) if profile_id else None
+    return ExecutionPipeline(registry=registry, profile=profile)
+
+
+def _init_worker(profile_id: str | None) -> None:
+    """Load the registry and bind the profile once per worker process."""
+    global _worker_pipeline
+    _worker_pipeline = _build_pipeline(profile_id)
+
+
+def _lint_one(path: Path, max_bytes: int | None) -> PipelineResult:
+    """Parse and validate a single file in a pool worker."""
+    if _worker_pipeline is None:
+        raise RuntimeError("Worker not initialized")
+    return _worker_pipeline.run(parse_file(path, max_bytes=max_bytes))
+
+
+def run_files(
+    paths: Sequence[Path | str],
+    profile: str | None = None,
+    workers: int | None = None,
+    *,
+    max_bytes: int | None = None,
+) -> list[PipelineResult]:
+    """
+    Validate several files, in parallel across processes.
+
+    Files are independent and validation is CPU-bound, so each worker
+    process validates whole files. With a single worker (or file) the
+    files are validated in this process, without a pool.
+
+    Args:
+        paths: Files to validate
+        profile: Profile ID, or None for all rules (as for validate())
+        workers: Number of worker processes (default: CPU count)
+        max_bytes: Maximum input size per file, as for parse_file()
+
+    Returns:
+        One PipelineResult per path, in input order
+    """
+    file_paths = [Path(path) for path in paths]
+    if not file_paths:
+        return []
+
+    workers = min(workers or os.cpu_count() or 1, len(file_paths))
+    if workers == 1:
+        pipeline = _build_pipeline(profile)
+        return [pipeline.run(parse_file(path, max_bytes=max_bytes)) for path in file_paths]
+
+    chunksize = max(1, len(file_paths) // (4 * workers))
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(profile,)
+    ) as executor:
+        return list(
+            executor.map(_lint_one, file_paths, [max_bytes] * len(file_paths), chunksize=chunksize)
+        )
@@ -31,7 +31,7 @@ def fixtures_dir() -> Path:
     return FIXTURES_DIR
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def golden_dir() -> Path:
     """Return the golden files directory path."""
     return GOLDEN_DIR
@@ -42,7 +42,7 @@ def golden_dir() -> Path:
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_minimal_700(golden_dir: Path) -> Path:
     """Minimal valid EXTF file with 10 rows (version 700)."""
     return golden_dir / "valid_minimal_700.csv"
@@ -100,27 +100,60 @@ def ttmm_ambiguous(golden_dir: Path) -> Path:
 # =============================================================================
 
 
-@pytest.fixture(scope="session")
-def large_file_50k(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
-    """Generate a 50k row DATEV file for performance testing."""
-    tmp_dir = tmp_path_factory.mktemp("benchmark")
-    file_path = tmp_dir / "large_50k.csv"
+# Bump whenever _generate_large_datev_file changes its output, so cached
+# files from earlier runs are not reused.
+_LARGE_FILE_VERSION = 2
 
-    # Generate file content
-    _generate_large_datev_file(file_path, num_rows=50_000)
 
-    yield file_path
+@pytest.fixture(scope="session")
+def large_file_50k(
+    pytestconfig: pytest.Config, tmp_path_factory: pytest.TempPathFactory
+) -> Iterator[Path]:
+    """Generate a 50k row DATEV file for performance testing."""
+    yield _large_datev_file(pytestconfig, tmp_path_factory, num_rows=50_000)
 
 
 @pytest.fixture(scope="session")
-def large_file_100k(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+def large_file_100k(
+    pytestconfig: pytest.Config, tmp_path_factory: pytest.TempPathFactory
+) -> Iterator[Path]:
     """Generate a 100k row DATEV file for performance testing."""
-    tmp_dir = tmp_path_factory.mktemp("benchmark")
-    file_path = tmp_dir / "large_100k.csv"
+    yield _large_datev_file(pytestconfig, tmp_path_factory, num_rows=100_000)
 
-    _generate_large_datev_file(file_path, num_rows=100_000)
 
-    yield file_path
+def _large_datev_file(
+    pytestconfig: pytest.Config, tmp_path_factory: pytest.TempPathFactory, num_rows: int
+) -> Path:
+    """
+    Return a generated benchmark file, reusing it across test sessions.
+
+    Files live in the pytest cache directory (or a temp dir if the cache
+    plugin is disabled) and are only generated when missing.
+    """
+    cache = getattr(pytestconfig, "cache", None)
+    if cache is not None:
+        cache_dir = cache.mkdir("datev-lint-benchmark")
+    else:
+        cache_dir = tmp_path_factory.mktemp("benchmark")
+
+    file_path = cache_dir / f"large_{num_rows}_v{_LARGE_FILE_VERSION}.csv"
+    if not file_path.exists():
+        # Generate next to the target and rename, so concurrent sessions
+        # never see a partially written file.
+        partial_path = file_path.with_suffix(f".{tmp_path_factory.getbasetemp().name}.tmp")
+        _generate_large_datev_file(partial_path, num_rows=num_rows)
+        partial_path.replace(file_path)
+
+    return file_path
+
+
+# One booking row of the generated benchmark file
+_LARGE_FILE_ROW_TEMPLATE = (
+    b'"%d,%02d";"S";"EUR";"";"";"";'
+    b'"%04d";"%04d";"";'
+    b'"%02d%02d";"RE%06d";"";'
+    b'"";"Buchung %d";"";"";\r\n'
+)
 
 
 def _generate_large_datev_file(path: Path, num_rows: int) -> None:
@@ -132,13 +165,13 @@ def _generate_large_datev_file(path: Path, num_rows: int) -> None:
     # Header line 1 (metadata)
     header1 = (
         '"EXTF";700;21;"Buchungsstapel";13;'
-        "20250101000000000;;;;;"
+        "20250101000000000;;;;;;"
         '"12345";"67890";'  # Beraternummer, Mandantennummer
         "20250101;4;"  # WJ-Beginn, Sachkontenlänge
         "20250101;20251231;"  # Zeitraum
         '"Test Benchmark";;'  # Bezeichnung, Diktatkürzel
         '"";"";;'  # Buchungstyp, Rechnungslegung
-        ';"";"EUR";'  # reserviert, WKZ
+        '"";"EUR";'  # reserviert, WKZ
         ";;;;;"  # Derivat, Kost1, Kost2, Herkunft
         ";0"  # Festschreibung
     )
@@ -151,29 +184,29 @@ def _generate_large_datev_file(path: Path, num_rows: int) -> None:
         '"Skonto";"Buchungstext";"Postensperre";"Diverses Konto"'
     )
 
-    lines = [header1, header2]
-
-    # Generate booking rows
-    for i in range(1, num_rows + 1):
-        amount = f"{100 + (i % 1000)},{i % 100:02d}"
-        konto = f"{1000 + (i % 9000):04d}"
-        gegenkonto = f"{8000 + (i % 1000):04d}"
-        belegfeld1 = f"RE{i:06d}"
-        tag = (i % 28) + 1
-        monat = (i % 12) + 1
-        belegdatum = f"{tag:02d}{monat:02d}"
-
-        row = (
-            f'"{amount}";"S";"EUR";"";"";"";'
-            f'"{konto}";"{gegenkonto}";"";'
-            f'"{belegdatum}";"{belegfeld1}";"";'
-            f'"";"Buchung {i}";"";"";'
-        )
-        lines.append(row)
-
-    # Write with Windows line endings
-    content = "\r\n".join(lines) + "\r\n"
-    path.write_bytes(content.encode("windows-1252"))
+    # Stream rows to the file with Windows line endings instead of joining
+    # all rows into one large string first.
+    with path.open("wb") as f:
+        f.write((header1 + "\r\n").encode("windows-1252"))
+        f.write((header2 + "\r\n").encode("windows-1252"))
+
+        # Generate booking rows (all substitutions are integers, so the
+        # template formats straight to bytes)
+        write = f.write
+        for i in range(1, num_rows + 1):
+            write(
+                _LARGE_FILE_ROW_TEMPLATE
+                % (
+                    100 + (i % 1000),  # Umsatz (euros)
+                    i % 100,  # Umsatz (cents)
+                    1000 + (i % 9000),  # Konto
+                    8000 + (i % 1000),  # Gegenkonto
+                    (i % 28) + 1,  # Belegdatum (TT)
+                    (i % 12) + 1,  # Belegdatum (MM)
+                    i,  # Belegfeld 1
+                    i,  # Buchungstext
+                )
+            )
 
 
 # =============================================================================
@@ -203,3 +236,13 @@ def sample_column_header() -> str:
         '"Belegdatum";"Belegfeld 1";"Belegfeld 2";'
         '"Skonto";"Buchungstext"'
     )
+
+
+@pytest.fixture(autouse=True)
+def _isolate_license_cache() -> Iterator[None]:
+    """Reset the process-wide license loader around every test."""
+    from datev_lint.core.licensing.loader import reset_license_cache
+
+    reset_license_cache()
+    yield
+    reset_license_cache()
@@ -6,14 +6,19 @@ is set to a directory containing `.csv` files.
 
 from __future__ import annotations
 
+import itertools
 import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 from typer.testing import CliRunner
 
 from datev_lint.cli.main import app
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 runner = CliRunner()
 
 
@@ -40,6 +45,23 @@ def _get_limit() -> int:
     return value
 
 
+def _iter_csvs(root: Path) -> Iterator[Path]:
+    """Yield .csv files under root depth-first, in sorted order per directory."""
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+        subdirs: list[str] = []
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.name.endswith(".csv") and entry.is_file():
+                yield Path(entry.path)
+        stack.extend(reversed(subdirs))
+
+
 def _max_bytes_args() -> list[str]:
     raw = os.environ.get("DATEV_LINT_INTEGRATION_MAX_BYTES")
     if raw is None or not raw.strip():
@@ -51,14 +73,11 @@ def test_validate_real_exports_as_json() -> None:
     integration_dir = _get_integration_dir()
     limit = _get_limit()
 
-    files = sorted(
-        p for p in integration_dir.rglob("*.csv") if p.is_file() and not p.name.startswith(".")
-    )
-    if not files:
+    csvs = _iter_csvs(integration_dir)
+    files_to_check = list(csvs) if limit <= 0 else list(itertools.islice(csvs, limit))
+    if not files_to_check:
         pytest.skip(f"No .csv files found under: {integration_dir}")
 
-    files_to_check = files if limit <= 0 else files[:limit]
-
     for file_path in files_to_check:
         result = runner.invoke(
             app,
@@ -0,0 +1,35 @@
+"""Smoke tests on the generated large DATEV files.
+
+Marked slow: deselect with `-m "not slow"`.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from datev_lint.core.parser import parse_file
+from datev_lint.core.rules import validate
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+pytestmark = [pytest.mark.slow, pytest.mark.benchmark]
+
+
+def test_validate_large_file_50k(large_file_50k: Path) -> None:
+    result = validate(parse_file(large_file_50k), profile="default")
+
+    assert result.findings == []
+    assert result.row_count == 50_000
+    assert result.stats["rows_checked"] == 50_000
+
+
+def test_parse_large_file_100k_hits_row_limit(large_file_100k: Path) -> None:
+    result = parse_file(large_file_100k)
+
+    assert result.header_errors == []
+    rows, errors = result.materialize()
+    assert len(rows) == 99_999
+    assert [error.code for error in errors] == ["DVL-ROW-001"]
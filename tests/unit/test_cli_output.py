@@ -92,6 +92,17 @@ class TestJsonOutput:
         assert "message" in finding
         assert "location" in finding
 
+    def test_indent(self) -> None:
+        """Test the indent width is honoured."""
+        findings = [make_finding()]
+
+        compact = JsonOutput(indent=None).render_findings(findings)
+        wide = JsonOutput(indent=4).render_findings(findings)
+
+        assert "\n" not in compact
+        assert '\n    "findings"' in wide
+        assert json.loads(compact) == json.loads(wide)
+
     def test_render_patch_plan(self) -> None:
         """Test rendering patch plan as JSON."""
         from datev_lint.core.fix.models import Patch, PatchOperation, PatchPlan
@@ -229,3 +240,18 @@ class TestJunitOutput:
         assert root.attrib["failures"] == "2"
         assert root.attrib["errors"] == "1"
         assert root.attrib["skipped"] == "1"
+
+    def test_render_escapes_markup(self) -> None:
+        """Test messages with markup and newlines round-trip through the XML."""
+        message = 'Wert <"A&B">\nzweite Zeile'
+        findings = [make_finding(message=message)]
+
+        output = JunitOutput()
+        xml = output.render_findings(findings)
+        root = ET.fromstring(xml)  # noqa: S314
+
+        failure = root.find("testcase/failure")
+        assert failure is not None
+        assert failure.attrib["message"] == message
+        assert failure.text is not None
+        assert message in failure.text
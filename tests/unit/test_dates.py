@@ -84,3 +84,12 @@ class TestDeriveYear:
         assert result.day == 1
         assert result.month == 12
         assert result.derived_date == date(2025, 12, 1)
+
+    def test_repeated_dates_share_result(self) -> None:
+        """Test that repeated derivations with the same context are reused."""
+        first = derive_year("1503", period_from=date(2025, 1, 1), period_to=date(2025, 12, 31))
+        second = derive_year("1503", None, date(2025, 1, 1), date(2025, 12, 31))
+        other = derive_year("1503", period_from=date(2024, 1, 1), period_to=date(2024, 12, 31))
+
+        assert second is first
+        assert other.year == 2024
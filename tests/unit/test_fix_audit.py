@@ -134,6 +134,17 @@ class TestAuditLogger:
         entries = logger.list_entries()
         assert len(entries) == 3
 
+    def test_list_entries_skips_other_files(self, tmp_path: Path) -> None:
+        """Test only regular, non-hidden .json files are listed."""
+        logger = AuditLogger(audit_dir=tmp_path)
+        logger.log_fix(run_id="abc123", plan=make_plan(), result=make_result())
+        (tmp_path / "notes.txt").write_text("x", encoding="utf-8")
+        (tmp_path / ".hidden.json").write_text("{}", encoding="utf-8")
+        (tmp_path / "dir.json").mkdir()
+
+        entries = logger.list_entries()
+        assert [e.run_id for e in entries] == ["abc123"]
+
     def test_list_entries_with_filter(self, tmp_path: Path) -> None:
         """Test listing entries with file filter."""
         logger = AuditLogger(audit_dir=tmp_path)
@@ -74,6 +74,16 @@ class TestConflictDetector:
         assert len(resolved) == 1
         assert resolved[0].operation == PatchOperation.UPPER
 
+    def test_first_wins_drops_identical_duplicate(self) -> None:
+        """Test an identical duplicate patch is resolved like any other conflict."""
+        patches = [make_patch(row_no=3), make_patch(row_no=3)]
+
+        resolved, conflicts = detect_conflicts(patches)
+
+        assert len(conflicts) == 1
+        assert len(resolved) == 1
+        assert resolved[0] is patches[0]
+
     def test_last_wins_resolution(self) -> None:
         """Test last-wins resolution."""
         patches = [
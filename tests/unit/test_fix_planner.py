@@ -165,6 +165,38 @@ class TestPatchPlanner:
         assert plan.total_patches == 1
         assert plan.patches[0].operation == PatchOperation.TRUNCATE
 
+    def test_plan_resolves_identical_duplicates(self, tmp_path: Path) -> None:
+        """Test identical fix candidates for one cell produce a single patch."""
+        test_file = tmp_path / "test.csv"
+        test_file.write_text("test content")
+
+        candidate = FixCandidate(
+            operation="upper",
+            field="belegfeld1",
+            old_value="test",
+            new_value="TEST",
+            risk=RiskLevel.LOW,
+        )
+        findings = [
+            Finding(
+                code="DVL-FIELD-011",
+                rule_version="1.0.0",
+                engine_version="0.1.0",
+                severity=Severity.WARN,
+                title="Test",
+                message="Test finding",
+                location=Location(file=str(test_file), row_no=3, field="belegfeld1"),
+                fix_candidates=[candidate, candidate],
+            )
+        ]
+
+        planner = PatchPlanner()
+        plan = planner.plan(test_file, findings)
+
+        assert plan.has_conflicts
+        assert plan.total_patches == 1
+        assert plan.low_risk_count == 1
+
 
 class TestComputeChecksum:
     """Tests for checksum computation."""
@@ -1,5 +1,7 @@
 """Tests for risk management."""
 
+import pytest
+
 from datev_lint.core.fix.models import Patch, PatchOperation, PatchPlan
 from datev_lint.core.fix.risk import (
     filter_by_risk,
@@ -11,23 +13,45 @@ from datev_lint.core.fix.risk import (
 )
 from datev_lint.core.rules.models import RiskLevel
 
+_PATCH_PROTOTYPE = Patch(
+    row_no=3,
+    field="belegfeld1",
+    operation=PatchOperation.UPPER,
+    old_value="test",
+    new_value="TEST",
+    risk=RiskLevel.LOW,
+    requires_approval=False,
+    rule_id="DVL-TEST-001",
+    rule_version="1.0.0",
+)
+
 
 def make_patch(
     risk: RiskLevel = RiskLevel.LOW,
     requires_approval: bool = False,
     operation: PatchOperation = PatchOperation.UPPER,
 ) -> Patch:
-    """Helper to create patches."""
-    return Patch(
-        row_no=3,
-        field="belegfeld1",
-        operation=operation,
-        old_value="test",
-        new_value="TEST",
-        risk=risk,
-        requires_approval=requires_approval,
-        rule_id="DVL-TEST-001",
-        rule_version="1.0.0",
+    """Helper to create patches (copies of a validated prototype)."""
+    return _PATCH_PROTOTYPE.model_copy(
+        update={"risk": risk, "requires_approval": requires_approval, "operation": operation}
+    )
+
+
+@pytest.fixture(scope="module")
+def mixed_plan() -> PatchPlan:
+    """Read-only plan with one patch per risk level; the HIGH one needs approval."""
+    return PatchPlan(
+        file_path="test.csv",
+        file_checksum="abc",
+        patches=[
+            make_patch(risk=RiskLevel.LOW),
+            make_patch(risk=RiskLevel.MEDIUM),
+            make_patch(risk=RiskLevel.HIGH, requires_approval=True),
+        ],
+        conflicts=[],
+        low_risk_count=1,
+        medium_risk_count=1,
+        high_risk_count=1,
     )
 
 
@@ -52,67 +76,48 @@ class TestGetOperationRisk:
 class TestShouldApply:
     """Tests for should_apply."""
 
-    def test_low_risk_with_low_accept(self) -> None:
-        """Test low risk with low acceptance."""
-        patch = make_patch(risk=RiskLevel.LOW)
-        assert should_apply(patch, RiskLevel.LOW) is True
-
-    def test_medium_risk_with_low_accept(self) -> None:
-        """Test medium risk with low acceptance."""
-        patch = make_patch(risk=RiskLevel.MEDIUM)
-        assert should_apply(patch, RiskLevel.LOW) is False
-
-    def test_medium_risk_with_medium_accept(self) -> None:
-        """Test medium risk with medium acceptance."""
-        patch = make_patch(risk=RiskLevel.MEDIUM)
-        assert should_apply(patch, RiskLevel.MEDIUM) is True
-
-    def test_high_risk_with_high_accept(self) -> None:
-        """Test high risk with high acceptance."""
-        patch = make_patch(risk=RiskLevel.HIGH)
-        assert should_apply(patch, RiskLevel.HIGH) is True
-
-    def test_requires_approval_without_high_accept(self) -> None:
-        """Test requires_approval blocks unless high accept."""
-        patch = make_patch(risk=RiskLevel.LOW, requires_approval=True)
-        assert should_apply(patch, RiskLevel.LOW) is False
-        assert should_apply(patch, RiskLevel.MEDIUM) is False
-        assert should_apply(patch, RiskLevel.HIGH) is True
+    @pytest.mark.parametrize(
+        ("patch_risk", "requires_approval", "accept", "expected"),
+        [
+            (RiskLevel.LOW, False, RiskLevel.LOW, True),
+            (RiskLevel.MEDIUM, False, RiskLevel.LOW, False),
+            (RiskLevel.MEDIUM, False, RiskLevel.MEDIUM, True),
+            (RiskLevel.HIGH, False, RiskLevel.HIGH, True),
+            # requires_approval blocks unless high accept
+            (RiskLevel.LOW, True, RiskLevel.LOW, False),
+            (RiskLevel.LOW, True, RiskLevel.MEDIUM, False),
+            (RiskLevel.LOW, True, RiskLevel.HIGH, True),
+        ],
+    )
+    def test_should_apply(
+        self,
+        patch_risk: RiskLevel,
+        requires_approval: bool,
+        accept: RiskLevel,
+        expected: bool,
+    ) -> None:
+        """Test acceptance by patch risk, approval flag and accepted level."""
+        patch = make_patch(risk=patch_risk, requires_approval=requires_approval)
+        assert should_apply(patch, accept) is expected
 
 
 class TestFilterByRisk:
     """Tests for filter_by_risk."""
 
-    def test_filter_mixed_risks(self) -> None:
+    @pytest.mark.parametrize(
+        ("accept", "expected_risks"),
+        [
+            (RiskLevel.LOW, [RiskLevel.LOW]),
+            (RiskLevel.MEDIUM, [RiskLevel.LOW, RiskLevel.MEDIUM]),
+            (RiskLevel.HIGH, [RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH]),
+        ],
+    )
+    def test_filter_mixed_risks(
+        self, mixed_plan: PatchPlan, accept: RiskLevel, expected_risks: list[RiskLevel]
+    ) -> None:
         """Test filtering mixed risk levels."""
-        patches = [
-            make_patch(risk=RiskLevel.LOW),
-            make_patch(risk=RiskLevel.MEDIUM),
-            make_patch(risk=RiskLevel.HIGH),
-        ]
-
-        plan = PatchPlan(
-            file_path="test.csv",
-            file_checksum="abc",
-            patches=patches,
-            conflicts=[],
-            low_risk_count=1,
-            medium_risk_count=1,
-            high_risk_count=1,
-        )
-
-        # Filter with low acceptance
-        filtered = filter_by_risk(plan, RiskLevel.LOW)
-        assert len(filtered) == 1
-        assert filtered[0].risk == RiskLevel.LOW
-
-        # Filter with medium acceptance
-        filtered = filter_by_risk(plan, RiskLevel.MEDIUM)
-        assert len(filtered) == 2
-
-        # Filter with high acceptance
-        filtered = filter_by_risk(plan, RiskLevel.HIGH)
-        assert len(filtered) == 3
+        filtered = filter_by_risk(mixed_plan, accept)
+        assert [p.risk for p in filtered] == expected_risks
 
 
 class TestRequiresInteractiveApproval:
@@ -149,17 +154,15 @@ class TestGetRiskSummary:
 
     def test_summary(self) -> None:
         """Test risk summary."""
-        patches = [
-            make_patch(risk=RiskLevel.LOW),
-            make_patch(risk=RiskLevel.LOW),
-            make_patch(risk=RiskLevel.MEDIUM),
-            make_patch(risk=RiskLevel.HIGH, requires_approval=True),
-        ]
-
         plan = PatchPlan(
             file_path="test.csv",
             file_checksum="abc",
-            patches=patches,
+            patches=[
+                make_patch(risk=RiskLevel.LOW),
+                make_patch(risk=RiskLevel.LOW),
+                make_patch(risk=RiskLevel.MEDIUM),
+                make_patch(risk=RiskLevel.HIGH, requires_approval=True),
+            ],
             conflicts=[],
             low_risk_count=2,
             medium_risk_count=1,
@@ -177,25 +180,12 @@ class TestGetRiskSummary:
 class TestFormatRiskWarning:
     """Tests for format_risk_warning."""
 
-    def test_format_warning(self) -> None:
+    def test_format_warning(self, mixed_plan: PatchPlan) -> None:
         """Test formatting risk warning."""
-        patches = [
-            make_patch(risk=RiskLevel.LOW),
-            make_patch(risk=RiskLevel.HIGH, requires_approval=True),
-        ]
-
-        plan = PatchPlan(
-            file_path="test.csv",
-            file_checksum="abc",
-            patches=patches,
-            conflicts=[],
-            low_risk_count=1,
-            high_risk_count=1,
-        )
-
-        warning = format_risk_warning(plan)
+        warning = format_risk_warning(mixed_plan)
 
         assert "HIGH" in warning
+        assert "MEDIUM" in warning
         assert "LOW" in warning
         assert "approval" in warning.lower()
 
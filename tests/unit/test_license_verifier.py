@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import base64
 import json
+import os
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 
@@ -12,19 +13,41 @@ from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
 
 from datev_lint.core.licensing import FREE_LICENSE, LicenseTier, VerificationError, get_license
-from datev_lint.core.licensing.loader import reset_license_cache
 from datev_lint.core.licensing.verifier import LicenseVerifier
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
 
-def _make_test_keypair(public_key_path: Path) -> Ed25519PrivateKey:
+@pytest.fixture(scope="module")
+def signing_keypair() -> tuple[Ed25519PrivateKey, bytes]:
+    """One Ed25519 key pair (private key, public PEM) shared by this module."""
     private_key = Ed25519PrivateKey.generate()
-    public_key = private_key.public_key()
-    public_key_path.write_bytes(
-        public_key.public_bytes(encoding=Encoding.PEM, format=PublicFormat.SubjectPublicKeyInfo)
+    public_pem = private_key.public_key().public_bytes(
+        encoding=Encoding.PEM, format=PublicFormat.SubjectPublicKeyInfo
     )
+    return private_key, public_pem
+
+
+@pytest.fixture(scope="module")
+def configured_public_key(
+    tmp_path_factory: pytest.TempPathFactory,
+    signing_keypair: tuple[Ed25519PrivateKey, bytes],
+) -> Iterator[Path]:
+    """Public key written once and exposed via DATEV_LINT_PUBLIC_KEY_PATH."""
+    key_path = tmp_path_factory.mktemp("keys") / "public_key.pem"
+    key_path.write_bytes(signing_keypair[1])
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("DATEV_LINT_PUBLIC_KEY_PATH", str(key_path))
+        yield key_path
+
+
+def _make_test_keypair(
+    public_key_path: Path, keypair: tuple[Ed25519PrivateKey, bytes]
+) -> Ed25519PrivateKey:
+    private_key, public_pem = keypair
+    public_key_path.write_bytes(public_pem)
     return private_key
 
 
@@ -34,9 +57,11 @@ def _sign_license(private_key: Ed25519PrivateKey, license_data: dict[str, object
     return base64.b64encode(private_key.sign(message)).decode("ascii")
 
 
-def test_license_verifier_accepts_valid_signature(tmp_path: Path) -> None:
+def test_license_verifier_accepts_valid_signature(
+    tmp_path: Path, signing_keypair: tuple[Ed25519PrivateKey, bytes]
+) -> None:
     key_path = tmp_path / "public_key.pem"
-    private_key = _make_test_keypair(key_path)
+    private_key = _make_test_keypair(key_path, signing_keypair)
 
     license_data: dict[str, object] = {
         "license_id": "lic_test_pro_001",
@@ -56,9 +81,11 @@ def test_license_verifier_accepts_valid_signature(tmp_path: Path) -> None:
     assert license_obj.tier == LicenseTier.PRO
 
 
-def test_license_verifier_rejects_invalid_signature(tmp_path: Path) -> None:
+def test_license_verifier_rejects_invalid_signature(
+    tmp_path: Path, signing_keypair: tuple[Ed25519PrivateKey, bytes]
+) -> None:
     key_path = tmp_path / "public_key.pem"
-    _make_test_keypair(key_path)
+    _make_test_keypair(key_path, signing_keypair)
 
     license_data: dict[str, object] = {
         "license_id": "lic_test_pro_001",
@@ -79,12 +106,37 @@ def test_license_verifier_rejects_invalid_signature(tmp_path: Path) -> None:
         verifier.verify(license_data)
 
 
-def test_get_license_returns_free_on_verification_failure(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+def test_license_verifier_reloads_replaced_key(
+    tmp_path: Path, signing_keypair: tuple[Ed25519PrivateKey, bytes]
 ) -> None:
     key_path = tmp_path / "public_key.pem"
-    _make_test_keypair(key_path)
+    private_key = _make_test_keypair(key_path, signing_keypair)
 
+    license_data: dict[str, object] = {
+        "license_id": "lic_test_pro_001",
+        "tier": "pro",
+        "issued_at": "2025-01-01T00:00:00Z",
+        "signature": "",
+    }
+    license_data["signature"] = _sign_license(private_key, license_data)
+    assert LicenseVerifier(public_key_path=key_path).verify(license_data).tier == LicenseTier.PRO
+
+    stat = key_path.stat()
+    other_key = Ed25519PrivateKey.generate()
+    key_path.write_bytes(
+        other_key.public_key().public_bytes(
+            encoding=Encoding.PEM, format=PublicFormat.SubjectPublicKeyInfo
+        )
+    )
+    # Keep the old mtime: the replaced key must still be picked up.
+    os.utime(key_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    with pytest.raises(VerificationError):
+        LicenseVerifier(public_key_path=key_path).verify(license_data)
+
+
+@pytest.mark.usefixtures("configured_public_key")
+def test_get_license_returns_free_on_verification_failure(tmp_path: Path) -> None:
     expires_at = datetime.now(UTC) + timedelta(days=30)
     license_data: dict[str, object] = {
         "license_id": "lic_test_pro_001",
@@ -99,18 +151,15 @@ def test_get_license_returns_free_on_verification_failure(
     license_path = tmp_path / "license.json"
     license_path.write_text(json.dumps(license_data), encoding="utf-8")
 
-    monkeypatch.setenv("DATEV_LINT_PUBLIC_KEY_PATH", str(key_path))
-    reset_license_cache()
-
     loaded = get_license(path=license_path)
     assert loaded == FREE_LICENSE
 
 
+@pytest.mark.usefixtures("configured_public_key")
 def test_get_license_verifies_when_key_is_configured(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, signing_keypair: tuple[Ed25519PrivateKey, bytes]
 ) -> None:
-    key_path = tmp_path / "public_key.pem"
-    private_key = _make_test_keypair(key_path)
+    private_key = signing_keypair[0]
 
     license_data: dict[str, object] = {
         "license_id": "lic_test_pro_001",
@@ -127,8 +176,5 @@ def test_get_license_verifies_when_key_is_configured(
     license_path = tmp_path / "license.json"
     license_path.write_text(json.dumps(license_data), encoding="utf-8")
 
-    monkeypatch.setenv("DATEV_LINT_PUBLIC_KEY_PATH", str(key_path))
-    reset_license_cache()
-
     loaded = get_license(path=license_path)
     assert loaded.tier == LicenseTier.PRO
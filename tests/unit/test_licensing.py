@@ -198,9 +198,6 @@ class TestRequireFeatureDecorator:
 
     def test_decorator_blocks_without_license(self) -> None:
         """Test decorator blocks without proper license."""
-        from datev_lint.core.licensing.loader import reset_license_cache
-
-        reset_license_cache()
 
         @require_feature(Feature.FIX_APPLY)
         def pro_function() -> str:
@@ -7,26 +7,33 @@ import pytest
 from datev_lint.core.parser import (
     DetectedFormat,
     ParserError,
+    ParseResult,
     parse_bytes,
     parse_file,
 )
 
 
+@pytest.fixture(scope="module")
+def parsed_minimal_700(valid_minimal_700: Path) -> ParseResult:
+    """valid_minimal_700 parsed once; rows are re-streamed on each iteration."""
+    return parse_file(valid_minimal_700)
+
+
 class TestParseFile:
     """Tests for parse_file function."""
 
-    def test_parse_valid_file(self, valid_minimal_700: Path) -> None:
+    def test_parse_valid_file(self, parsed_minimal_700: ParseResult) -> None:
         """Test parsing a valid minimal DATEV file."""
-        result = parse_file(valid_minimal_700)
+        result = parsed_minimal_700
 
         assert result.detected_format == DetectedFormat.DATEV_FORMAT
         assert result.header.header_version == 700
         assert result.header.format_category == 21
         assert result.header.format_name == "Buchungsstapel"
 
-    def test_header_metadata(self, valid_minimal_700: Path) -> None:
+    def test_header_metadata(self, parsed_minimal_700: ParseResult) -> None:
         """Test that header metadata is correctly parsed."""
-        result = parse_file(valid_minimal_700)
+        result = parsed_minimal_700
 
         # Leading zeros preserved as strings
         assert result.header.beraternummer == "00001"
@@ -36,28 +43,57 @@ class TestParseFile:
         assert result.header.period_from is not None
         assert result.header.period_to is not None
 
-    def test_row_iteration(self, valid_minimal_700: Path) -> None:
+    def test_row_iteration(self, parsed_minimal_700: ParseResult) -> None:
         """Test iterating over rows."""
-        result = parse_file(valid_minimal_700)
+        result = parsed_minimal_700
 
-        rows = []
-        for item in result.rows:
-            if isinstance(item, ParserError):
-                continue
-            rows.append(item)
+        rows = list(result.booking_rows)
 
         assert len(rows) == 10
 
+    def test_booking_rows_skip_errors(self) -> None:
+        """Test that booking_rows yields parsed rows without row errors."""
+        data = b""""EXTF";700;21;"Buchungsstapel";13;20250101000000000;;;;;;"00001";"00002";20250101;4;20250101;20251231;"Test";;"";"";;"";"";"EUR";;;;;;;0
+"Umsatz";"S/H";"Konto";"Gegenkonto";"Belegdatum"
+"100,00";"S";"1200";"8400";"1501"
+"abc";"S";"1200";"8400";"1501"
+"""
+        result = parse_bytes(data, "<test>")
+
+        items = list(result.rows)
+        rows = list(result.booking_rows)
+
+        assert any(isinstance(item, ParserError) for item in items)
+        assert not any(isinstance(row, ParserError) for row in rows)
+        assert [row.row_no for row in rows] == [
+            item.row_no for item in items if not isinstance(item, ParserError)
+        ]
+
+    def test_booking_rows_with_zero_argument_factory(self) -> None:
+        """Test that booking_rows filters rows for factories without include_errors."""
+        data = b""""EXTF";700;21;"Buchungsstapel";13;20250101000000000;;;;;;"00001";"00002";20250101;4;20250101;20251231;"Test";;"";"";;"";"";"EUR";;;;;;;0
+"Umsatz";"S/H";"Konto";"Gegenkonto";"Belegdatum"
+"100,00";"S";"1200";"8400";"1501"
+"abc";"S";"1200";"8400";"1501"
+"""
+        parsed = parse_bytes(data, "<test>")
+        result = parsed.model_copy(update={"row_factory_fn": lambda: parsed.rows})
+
+        rows = list(result.booking_rows)
+
+        assert [row.row_no for row in rows] == [row.row_no for row in parsed.booking_rows]
+
     def test_leading_zeros_in_konto(self, leading_zero_konto: Path) -> None:
         """Test that leading zeros in account numbers are preserved."""
         result = parse_file(leading_zero_konto)
 
-        for item in result.rows:
-            if isinstance(item, ParserError):
-                continue
+        rows = list(result.booking_rows)
+        assert rows
+
+        for row in rows:
             # Konto should start with leading zeros
-            assert item.konto is not None
-            assert item.konto.startswith("000"), f"Leading zeros lost: {item.konto}"
+            assert row.konto is not None
+            assert row.konto.startswith("000"), f"Leading zeros lost: {row.konto}"
 
     def test_file_not_found(self) -> None:
         """Test that FileNotFoundError is raised for missing files."""
@@ -109,9 +145,9 @@ class TestParseBytes:
 class TestMaterialize:
     """Tests for ParseResult.materialize method."""
 
-    def test_materialize_rows(self, valid_minimal_700: Path) -> None:
+    def test_materialize_rows(self, parsed_minimal_700: ParseResult) -> None:
         """Test materializing all rows."""
-        result = parse_file(valid_minimal_700)
+        result = parsed_minimal_700
         rows, _errors = result.materialize()
 
         assert len(rows) == 10
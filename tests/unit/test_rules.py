@@ -46,6 +46,157 @@ class TestRuleRegistry:
         assert profile is not None
         assert profile.id == "default"
 
+    def test_invalid_rule_does_not_drop_file(self, tmp_path: Path) -> None:
+        """Test that one invalid rule is skipped while the others load."""
+        from datev_lint.core.rules.loader import load_rules_from_yaml
+
+        rules_file = tmp_path / "rules.yaml"
+        rules_file.write_text(
+            "rules:\n"
+            "  DVL-TEST-001:\n"
+            "    stage: schema\n"
+            "    constraint: {type: required}\n"
+            "  DVL-TEST-002:\n"
+            "    stage: no-such-stage\n",
+            encoding="utf-8",
+        )
+
+        rules = load_rules_from_yaml(rules_file)
+        assert [rule.id for rule in rules] == ["DVL-TEST-001"]
+
+    def test_rules_for_profile_cached_until_registration(self) -> None:
+        """Test that profile rule selection is recomputed after a registration."""
+        from datev_lint.core.rules.models import Constraint, Profile, Rule, Stage
+        from datev_lint.core.rules.registry import RuleRegistry
+
+        registry = RuleRegistry()
+        profile = Profile(id="test", version="1.0.0", label="Test", enable=["DVL-TEST-*"])
+        assert registry.get_rules_for_profile(profile) == []
+
+        registry.register_rule(
+            Rule(
+                id="DVL-TEST-001",
+                version="1.0.0",
+                title="Konto required",
+                stage=Stage.SCHEMA,
+                severity=Severity.ERROR,
+                selector={"field": "konto"},
+                constraint=Constraint(type="required"),
+            )
+        )
+        assert [rule.id for rule in registry.get_rules_for_profile(profile)] == ["DVL-TEST-001"]
+
+        other = Profile(id="test", version="1.0.0", label="Test", enable=["DVL-OTHER-*"])
+        assert registry.get_rules_for_profile(other) == []
+
+    def test_rules_for_profile_glob_patterns(self) -> None:
+        """Test enable/disable globs and explicitly disabled rules."""
+        import fnmatch
+
+        from datev_lint.core.rules.models import Profile, ProfileOverrides
+
+        registry = get_registry()
+        profile = Profile(
+            id="globs",
+            version="1.0.0",
+            label="Globs",
+            enable=["DVL-FIELD-*", "DVL-ROW-0[0-4]?"],
+            disable=["DVL-FIELD-00?"],
+            overrides=ProfileOverrides(disabled=["DVL-FIELD-011"]),
+        )
+
+        expected = [
+            rule.id
+            for rule in registry.rules.values()
+            if not rule.deprecated
+            and any(fnmatch.fnmatch(rule.id, p) for p in profile.enable)
+            and not fnmatch.fnmatch(rule.id, "DVL-FIELD-00?")
+            and rule.id != "DVL-FIELD-011"
+        ]
+        assert expected
+        assert [rule.id for rule in registry.get_rules_for_profile(profile)] == expected
+
+    def test_profile_inheritance_chain(self) -> None:
+        """Test that multi-level inheritance merges from the root down."""
+        from datev_lint.core.rules.models import Profile, ProfileOverrides
+        from datev_lint.core.rules.registry import RuleRegistry
+
+        registry = RuleRegistry()
+        registry.register_profile(
+            Profile(
+                id="root",
+                version="1.0.0",
+                label="Root",
+                enable=["DVL-FIELD-*"],
+                overrides=ProfileOverrides(severity={"DVL-FIELD-001": "warn"}, disabled=["A"]),
+            )
+        )
+        registry.register_profile(
+            Profile(
+                id="mid",
+                version="1.0.0",
+                label="Mid",
+                base="root",
+                enable=["DVL-ROW-*", "DVL-FIELD-*"],
+                disable=["DVL-FIELD-00?"],
+                overrides=ProfileOverrides(severity={"DVL-FIELD-001": "error"}, disabled=["B"]),
+            )
+        )
+        leaf = Profile(id="leaf", version="1.0.0", label="Leaf", base="mid", enable=["DVL-HDR-*"])
+
+        resolved = registry._resolve_profile(leaf)
+
+        assert resolved.base is None
+        assert resolved.enable == ["DVL-FIELD-*", "DVL-ROW-*", "DVL-HDR-*"]
+        assert resolved.disable == ["DVL-FIELD-00?"]
+        assert resolved.overrides.severity == {"DVL-FIELD-001": "error"}
+        assert resolved.overrides.disabled == ["A", "B"]
+
+    def test_profile_inheritance_cycle(self) -> None:
+        """Test that cyclic profile bases do not recurse forever."""
+        from datev_lint.core.rules.models import Profile
+        from datev_lint.core.rules.registry import RuleRegistry
+
+        registry = RuleRegistry()
+        registry.register_profile(Profile(id="a", version="1.0.0", label="A", base="b"))
+        registry.register_profile(
+            Profile(id="b", version="1.0.0", label="B", base="a", enable=["DVL-*"])
+        )
+
+        resolved = registry._resolve_profile(registry.profiles["a"])
+
+        assert resolved.enable == ["DVL-*", "*"]
+
+    def test_severity_override_keeps_rule_fields(self) -> None:
+        """Test that a severity override only changes the severity."""
+        from datev_lint.core.rules.models import Constraint, Profile, ProfileOverrides, Rule, Stage
+        from datev_lint.core.rules.registry import RuleRegistry
+
+        rule = Rule(
+            id="DVL-CROSS-001",
+            version="1.0.0",
+            title="Duplicate Belegfeld 1",
+            stage=Stage.CROSS_ROW,
+            severity=Severity.WARN,
+            constraint=Constraint(type="unique"),
+            columns_needed=["belegfeld1"],
+        )
+        registry = RuleRegistry()
+        registry.register_rule(rule)
+        profile = Profile(
+            id="strict",
+            version="1.0.0",
+            label="Strict",
+            enable=["*"],
+            overrides=ProfileOverrides(severity={"DVL-CROSS-001": "error"}),
+        )
+
+        [overridden] = registry.get_rules_for_profile(profile)
+
+        assert overridden.severity == Severity.ERROR
+        assert overridden == rule.model_copy(update={"severity": Severity.ERROR})
+        assert rule.severity == Severity.WARN
+
 
 class TestValidation:
     """Tests for validation function."""
@@ -71,7 +222,7 @@ class TestValidation:
         validation = validate(result)
 
         # Should find invalid S/H
-        sh_findings = [f for f in validation.findings if f.code == "DVL-FIELD-005"]
+        sh_findings = validation.findings_for("DVL-FIELD-005")
         assert len(sh_findings) >= 1
 
     def test_validate_detects_missing_konto(self) -> None:
@@ -86,7 +237,7 @@ class TestValidation:
         validation = validate(result)
 
         # Should find missing Konto
-        konto_findings = [f for f in validation.findings if f.code == "DVL-FIELD-001"]
+        konto_findings = validation.findings_for("DVL-FIELD-001")
         assert len(konto_findings) >= 1
 
     def test_validate_detects_belegfeld1_issues(self) -> None:
@@ -101,11 +252,234 @@ class TestValidation:
         validation = validate(result)
 
         # Should find Belegfeld 1 character issues
-        bf_findings = [
-            f for f in validation.findings if f.code in ("DVL-FIELD-011", "DVL-FIELD-013")
-        ]
+        bf_findings = validation.findings_for("DVL-FIELD-011", "DVL-FIELD-013")
         assert len(bf_findings) >= 1
 
+    def test_validate_skips_rows_without_row_rules(self) -> None:
+        """Test that rows are not walked when the profile has no row rules."""
+        from datev_lint.core.parser import parse_bytes
+        from datev_lint.core.rules.models import Profile
+
+        data = b""""EXTF";700;21;"Buchungsstapel";13;20250101000000000;;;;;;"00001";"00002";20250101;4;20250101;20251231;"Test";;"";"";;"";"";"EUR";;;;;;;0
+"Umsatz";"S/H";"Konto";"Gegenkonto";"Belegdatum"
+"100,00";"X";"";"8400";"1501"
+"""
+        result = parse_bytes(data, "<test>")
+        profile = Profile(id="no-rows", version="1.0.0", label="No rows", enable=["DVL-HDR-*"])
+        validation = validate(result, profile)
+
+        assert validation.findings == []
+        assert validation.stats["rows_checked"] == 0
+
+    def test_row_rules_without_field_still_report_row_errors(self) -> None:
+        """Test that row rules without a field selector still walk the rows."""
+        from datev_lint.core.parser import parse_bytes
+        from datev_lint.core.rules.models import Constraint, Rule, Stage
+        from datev_lint.core.rules.pipeline import ExecutionPipeline
+        from datev_lint.core.rules.registry import RuleRegistry
+
+        data = b""""EXTF";700;21;"Buchungsstapel";13;20250101000000000;;;;;;"00001";"00002";20250101;4;20250101;20251231;"Test";;"";"";;"";"";"EUR";;;;;;;0
+"Umsatz";"S/H";"Konto";"Gegenkonto";"Belegdatum"
+"100,00";"S";"1200";"8400";"1501"
+"abc";"S";"1200";"8400";"1501"
+"200,00";"H";"1200";"8400";"1601"
+"""
+        registry = RuleRegistry()
+        registry.register_rule(
+            Rule(
+                id="DVL-SCHEMA-TEST",
+                version="1.0.0",
+                title="Rule without field selector",
+                stage=Stage.SCHEMA,
+                severity=Severity.ERROR,
+                constraint=Constraint(type="required"),
+            )
+        )
+
+        result = ExecutionPipeline(registry=registry).run(parse_bytes(data, "<test>"))
+
+        assert [f.code for f in result.findings] == ["DVL-FIELD-003"]
+        assert result.stats["rows_checked"] == 3
+
+    def test_header_rule(self) -> None:
+        """Test that header rules check the header field once."""
+        from datev_lint.core.parser import parse_bytes
+        from datev_lint.core.rules.models import Constraint, Rule, Stage
+        from datev_lint.core.rules.pipeline import ExecutionPipeline
+        from datev_lint.core.rules.registry import RuleRegistry
+
+        data = b""""EXTF";700;21;"Buchungsstapel";13;20250101000000000;;;;;;"00001";"00002";20250101;4;20250101;20251231;"Test";;"";"";;"";"";"EUR";;;;;;;0
+"Umsatz";"S/H";"Konto";"Gegenkonto";"Belegdatum"
+"""
+        registry = RuleRegistry()
+        registry.register_rule(
+            Rule(
+                id="DVL-HDR-TEST",
+                version="1.0.0",
+                title="Format must be Debitoren/Kreditoren",
+                stage=Stage.HEADER,
+                severity=Severity.ERROR,
+                selector={"field": "format_name"},
+                constraint=Constraint(type="enum", values=["Debitoren/Kreditoren"]),
+            )
+        )
+
+        result = ExecutionPipeline(registry=registry).run(parse_bytes(data, "<test>"))
+
+        assert [f.code for f in result.findings] == ["DVL-HDR-TEST"]
+        finding = result.findings[0]
+        assert finding.location.row_no == 1
+        assert finding.location.field == "format_name"
+        assert finding.context == {"raw_value": "Buchungsstapel"}
+
+
+class TestStreaming:
+    """Tests for streaming pipeline execution."""
+
+    def test_run_iter_matches_run(self) -> None:
+        """Test that run_iter yields the same findings as run."""
+        from datev_lint.core.parser import parse_bytes
+        from datev_lint.core.rules.pipeline import ExecutionPipeline
+
+        data = b""""EXTF";700;21;"Buchungsstapel";13;20250101000000000;;;;;;"00001";"00002";20250101;4;20250101;20251231;"Test";;"";"";;"";"";"EUR";;;;;;;0
+"Umsatz";"S/H";"Konto";"Gegenkonto";"Belegdatum";"Belegfeld 1"
+"100,00";"X";"";"8400";"1501";"re-1"
+"200,00";"S";"1200";"8400";"1601";"RE2"
+"""
+        pipeline = ExecutionPipeline()
+        expected = pipeline.run(parse_bytes(data, "<test>"))
+
+        streamed = list(pipeline.run_iter(parse_bytes(data, "<test>")))
+
+        assert streamed == expected.findings
+        assert pipeline.row_count == 2
+        assert pipeline.stats["rows_checked"] == 2
+        assert pipeline.aborted_at_stage is None
+
+    def test_run_iter_keeps_its_own_state(self) -> None:
+        """Test that a run started earlier publishes its own counters when it finishes."""
+        from datev_lint.core.parser import parse_bytes
+        from datev_lint.core.rules.pipeline import ExecutionPipeline
+
+        header = b""""EXTF";700;21;"Buchungsstapel";13;20250101000000000;;;;;;"00001";"00002";20250101;4;20250101;20251231;"Test";;"";"";;"";"";"EUR";;;;;;;0
+"Umsatz";"S/H";"Konto";"Gegenkonto";"Belegdatum";"Belegfeld 1"
+"""
+        two_rows = (
+            header
+            + b""""100,00";"X";"";"8400";"1501";"re-1"
+"200,00";"S";"1200";"8400";"1601";"RE2"
+"""
+        )
+        one_row = (
+            header
+            + b""""300,00";"S";"1200";"8400";"1701";"RE3"
+"""
+        )
+        pipeline = ExecutionPipeline()
+        streamed = pipeline.run_iter(parse_bytes(two_rows, "<test>"))
+        first = next(streamed)
+
+        result = pipeline.run(parse_bytes(one_row, "<test>"))
+        rest = list(streamed)
+
+        assert result.row_count == 1
+        assert result.stats["rows_checked"] == 1
+        assert pipeline.row_count == 2
+        assert pipeline.stats["rows_checked"] == 2
+        assert [first, *rest] == pipeline.run(parse_bytes(two_rows, "<test>")).findings
+
+    def test_plan_reused_until_registry_changes(self) -> None:
+        """Test that the compiled plan is cached across runs of one pipeline."""
+        from datev_lint.core.parser import parse_bytes
+        from datev_lint.core.rules.models import Constraint, Rule, Stage
+        from datev_lint.core.rules.pipeline import ExecutionPipeline
+        from datev_lint.core.rules.registry import RuleRegistry
+
+        data = b""""EXTF";700;21;"Buchungsstapel";13;20250101000000000;;;;;;"00001";"00002";20250101;4;20250101;20251231;"Test";;"";"";;"";"";"EUR";;;;;;;0
+"Umsatz";"S/H";"Konto";"Gegenkonto";"Belegdatum";"Belegfeld 1"
+"100,00";"S";"";"8400";"1501";"RE1"
+"""
+        registry = RuleRegistry()
+        pipeline = ExecutionPipeline(registry=registry)
+
+        assert pipeline.run(parse_bytes(data, "<test>")).findings == []
+        plan = pipeline._plan
+        pipeline.run(parse_bytes(data, "<test>"))
+        assert pipeline._plan is plan
+
+        registry.register_rule(
+            Rule(
+                id="DVL-TEST-001",
+                version="1.0.0",
+                title="Konto required",
+                stage=Stage.SCHEMA,
+                severity=Severity.ERROR,
+                selector={"field": "konto"},
+                constraint=Constraint(type="required"),
+            )
+        )
+        result = pipeline.run(parse_bytes(data, "<test>"))
+
+        assert pipeline._plan is not plan
+        assert [f.code for f in result.findings] == ["DVL-TEST-001"]
+
+
+class TestCrossRowColumns:
+    """Tests for column collection for cross-row rules."""
+
+    DATA = b""""EXTF";700;21;"Buchungsstapel";13;20250101000000000;;;;;;"00001";"00002";20250101;4;20250101;20251231;"Test";;"";"";;"";"";"EUR";;;;;;;0
+"Umsatz";"S/H";"Konto";"Gegenkonto";"Belegdatum";"Belegfeld 1"
+"100,00";"S";"1200";"8400";"1501";"RE1"
+"200,00";"H";"1200";"8400";"1601";"RE1"
+"""
+
+    @pytest.mark.parametrize("with_row_rules", [True, False])
+    def test_columns_collected_for_cross_row_rules(self, with_row_rules: bool) -> None:
+        """Test that declared columns are collected once for cross-row rules."""
+        from datev_lint.core.parser import parse_bytes
+        from datev_lint.core.rules.models import Constraint, Rule, Stage
+        from datev_lint.core.rules.pipeline import ExecutionPipeline
+        from datev_lint.core.rules.registry import RuleRegistry
+
+        registry = RuleRegistry()
+        registry.register_rule(
+            Rule(
+                id="DVL-CROSS-001",
+                version="1.0.0",
+                title="Duplicate Belegfeld 1",
+                stage=Stage.CROSS_ROW,
+                severity=Severity.WARN,
+                constraint=Constraint(type="unique"),
+                columns_needed=["belegfeld1"],
+            )
+        )
+        if with_row_rules:
+            registry.register_rule(
+                Rule(
+                    id="DVL-TEST-001",
+                    version="1.0.0",
+                    title="Konto required",
+                    stage=Stage.SCHEMA,
+                    severity=Severity.ERROR,
+                    selector={"field": "konto"},
+                    constraint=Constraint(type="required"),
+                )
+            )
+
+        seen: list[object] = []
+
+        class RecordingPipeline(ExecutionPipeline):
+            def _run_cross_row_rule(self, rule, parse_result, filename, findings):  # type: ignore[no-untyped-def]
+                seen.append(self._columns)
+                super()._run_cross_row_rule(rule, parse_result, filename, findings)
+
+        RecordingPipeline(registry=registry).run(parse_bytes(self.DATA, "<test>"))
+
+        assert len(seen) == 1
+        columns = seen[0]
+        assert columns.row_nos == [3, 4]  # type: ignore[attr-defined]
+        assert columns.values == {"belegfeld1": ["RE1", "RE1"]}  # type: ignore[attr-defined]
+
 
 class TestConstraints:
     """Tests for constraint checkers."""
@@ -120,6 +494,15 @@ class TestConstraints:
         assert ConstraintRegistry.check("12345", constraint) is True
         assert ConstraintRegistry.check("abc", constraint) is False
 
+    def test_invalid_regex_never_matches(self) -> None:
+        """Test that an invalid pattern is a violation, not an error."""
+        from datev_lint.core.rules.constraints import ConstraintRegistry
+        from datev_lint.core.rules.models import Constraint
+
+        constraint = Constraint(type="regex", pattern=r"^(\d+$")
+
+        assert ConstraintRegistry.check("12345", constraint) is False
+
     def test_max_length_constraint(self) -> None:
         """Test max_length constraint checker."""
         from datev_lint.core.rules.constraints import ConstraintRegistry
@@ -152,6 +535,58 @@ class TestConstraints:
         assert ConstraintRegistry.check("", constraint) is False
         assert ConstraintRegistry.check("   ", constraint) is False
 
+    def test_charset_constraint(self) -> None:
+        """Test charset constraint checker with a predefined charset."""
+        from datev_lint.core.rules.constraints import ConstraintRegistry
+        from datev_lint.core.rules.models import Constraint
+
+        constraint = Constraint(type="charset", params={"charset": "belegfeld1"})
+
+        assert ConstraintRegistry.check("RE-2025/001", constraint) is True
+        assert ConstraintRegistry.check("", constraint) is True
+        assert ConstraintRegistry.check("re-2025", constraint) is False
+        assert ConstraintRegistry.check("RE 2025", constraint) is False
+        assert ConstraintRegistry.check("RÄ-1", constraint) is False
+
+    @pytest.mark.parametrize(
+        "constraint_data",
+        [
+            {"type": "regex", "pattern": r"^\d+$"},
+            {"type": "regex", "pattern": "("},
+            {"type": "max_length", "value": 3},
+            {"type": "min_length", "value": 2},
+            {"type": "enum", "values": ["S", "H"]},
+            {"type": "required"},
+            {"type": "charset", "params": {"charset": "belegfeld1"}},
+            {"type": "charset", "params": {"charset": "digits"}},
+            {"type": "range", "params": {"min": 0, "max": 100}},
+            {"type": "unknown"},
+        ],
+    )
+    def test_compiled_constraint_matches_check(self, constraint_data: dict[str, object]) -> None:
+        """Test that compiled predicates agree with ConstraintRegistry.check."""
+        from datev_lint.core.rules.constraints import ConstraintRegistry
+        from datev_lint.core.rules.models import Constraint
+
+        constraint = Constraint.model_validate(constraint_data)
+        compiled = ConstraintRegistry.compile(constraint)
+
+        for value in ["", " ", "S", "123", "12a", "RE-1", "re-1", "50,5", "٣٤", "ABCDEFG"]:
+            assert compiled(value) is ConstraintRegistry.check(value, constraint)
+
+    def test_compiled_message_matches_get_message(self) -> None:
+        """Test that compiled message formatters agree with get_message."""
+        from datev_lint.core.rules.constraints import ConstraintRegistry
+        from datev_lint.core.rules.models import Constraint
+
+        for constraint in (
+            Constraint(type="max_length", value=3),
+            Constraint(type="unknown"),
+        ):
+            for lang in ("de", "en"):
+                compiled = ConstraintRegistry.compile_message(constraint, lang)
+                assert compiled("abcd") == ConstraintRegistry.get_message("abcd", constraint, lang)
+
 
 class TestPipelineResult:
     """Tests for PipelineResult."""
@@ -213,3 +648,67 @@ class TestPipelineResult:
             ]
         )
         assert result.has_errors is True
+
+    def test_findings_for(self) -> None:
+        """Test findings_for groups findings by the requested codes."""
+        from datev_lint.core.rules.models import Finding
+        from datev_lint.core.rules.pipeline import PipelineResult
+
+        def finding(code: str, title: str) -> Finding:
+            return Finding(
+                code=code,
+                rule_version="1.0.0",
+                engine_version="0.1.0",
+                severity=Severity.WARN,
+                title=title,
+                message="Test",
+            )
+
+        first, second, third = (
+            finding("DVL-TEST-001", "a"),
+            finding("DVL-TEST-002", "b"),
+            finding("DVL-TEST-001", "c"),
+        )
+        result = PipelineResult(findings=[first, second, third])
+
+        assert result.findings_for("DVL-TEST-001") == [first, third]
+        assert result.findings_for("DVL-TEST-002", "DVL-TEST-001") == [second, first, third]
+        assert result.findings_for("DVL-TEST-999") == []
+
+
+class TestRunFiles:
+    """Tests for the batch runner."""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_run_files_matches_validate(self, valid_minimal_700: Path, workers: int) -> None:
+        """Test that batch results match single-file validation, in input order."""
+        from datev_lint.core.rules import run_files
+
+        paths = [valid_minimal_700, valid_minimal_700]
+        expected = validate(parse_file(valid_minimal_700), profile="default")
+
+        results = run_files(paths, profile="default", workers=workers)
+
+        assert len(results) == 2
+        for result in results:
+            assert result.findings == expected.findings
+            assert result.row_count == expected.row_count
+            assert result.file == str(valid_minimal_700)
+
+    def test_run_files_in_process_uses_own_pipeline(self, valid_minimal_700: Path) -> None:
+        """Test that single-worker runs use their own pipeline and validate()'s default."""
+        from datev_lint.core.rules import run_files, runner
+
+        expected = validate(parse_file(valid_minimal_700))
+
+        results = run_files([valid_minimal_700], workers=1)
+
+        assert runner._worker_pipeline is None
+        assert results[0].findings == expected.findings
+        assert results[0].profile_id == expected.profile_id
+
+    def test_run_files_empty(self) -> None:
+        """Test that no paths give no results."""
+        from datev_lint.core.rules import run_files
+
+        assert run_files([]) == []
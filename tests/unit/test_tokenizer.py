@@ -1,5 +1,7 @@
 """Tests for CSV tokenizer."""
 
+import csv
+
 from datev_lint.core.parser.tokenizer import tokenize_line, tokenize_stream
 
 
@@ -36,6 +38,16 @@ class TestTokenizeLine:
         result = tokenize_line('"a;b";"c"')
         assert result == ["a;b", "c"]
 
+    def test_text_after_closing_quote(self) -> None:
+        """Test that text after a closing quote is kept verbatim."""
+        result = tokenize_line('"ab"c"d;e')
+        assert result == ['abc"d', "e"]
+
+    def test_unclosed_quote_after_escaped_quote(self) -> None:
+        """Test that an unclosed quote swallows later delimiters."""
+        result = tokenize_line('x;"a"";b')
+        assert result == ["x", 'a";b']
+
 
 class TestTokenizeStream:
     """Tests for tokenize_stream function."""
@@ -93,3 +105,16 @@ class TestTokenizeStream:
         records = list(tokenize_stream(text))
         assert [r[1] for r in records] == [1, 2, 3]
         assert [r[2] for r in records] == [1, 2, 3]
+
+    def test_field_over_csv_size_limit(self) -> None:
+        """Test that a field larger than csv.field_size_limit() still tokenizes."""
+        big = "x" * (csv.field_size_limit() + 1)
+        text = f'"a";"b"\r\n"{big}"\r\n"c";"d\ne"\r\n'
+        records = list(tokenize_stream(text))
+        assert [r[0] for r in records] == [["a", "b"], [big], ["c", "d\ne"]]
+        assert [(r[1], r[2]) for r in records] == [(1, 1), (2, 2), (3, 4)]
+
+    def test_unclosed_quote_at_end(self) -> None:
+        """Test that a trailing line break in an unclosed quote ends the last line."""
+        records = list(tokenize_stream('"a"\r"b\rc\r'))
+        assert records == [(["a"], 1, 1), (["b\rc\r"], 2, 3)]